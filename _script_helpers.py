@@ -0,0 +1,57 @@
+"""
+Shared helpers for the test scripts in the project root
+"""
+
+import atexit
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout
+from io import StringIO
+from typing import Iterator, List
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_local = threading.local()
+_sessions: List[requests.Session] = []
+_sessions_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Keep-alive session for the calling thread
+
+    requests.Session is not thread-safe (its cookie jar and adapters are
+    shared state), so each worker thread gets its own pooled session.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(max_retries=0))
+        _local.session = session
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+def _close_sessions():
+    with _sessions_lock:
+        for session in _sessions:
+            session.close()
+
+
+atexit.register(_close_sessions)
+
+
+@contextmanager
+def buffered_stdout() -> Iterator[None]:
+    """Collect everything printed inside the block and write it out once
+
+    The buffer is written even if the block raises or calls sys.exit().
+    """
+    buf = StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
@@ -0,0 +1,75 @@
+"""
+Numeric kernels for the student tracker
+Compiled with Numba when available, plain NumPy/Python otherwise. Each kernel
+compiles on its first call; the machine code is cached on disk next to this
+module, so later processes load it instead of recompiling
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def focus_score(times):
+    """Focus score from response times: 1 - coefficient of variation, clamped to [0, 1]"""
+    n = times.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    # Welford's one-pass mean/variance
+    for i in range(n):
+        delta = times[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (times[i] - mean)
+    if mean <= 0.0:
+        return 0.0
+    score = 1.0 - (m2 / n) ** 0.5 / mean
+    return min(1.0, max(0.0, score))
+
+
+@njit(cache=True)
+def batch_ema(current, accuracy, alpha):
+    """Exponential moving average of skill levels toward accuracy * 100, clamped to [0, 100]
+
+    Called per student with a handful of skills, so it is not parallelized.
+    """
+    out = np.empty_like(current)
+    for i in range(current.shape[0]):
+        value = (1.0 - alpha) * current[i] + alpha * (accuracy[i] * 100.0)
+        out[i] = min(100.0, max(0.0, value))
+    return out
+
+
+@njit(cache=True, parallel=True)
+def batch_slope(matrix):
+    """Least-squares trend slope for each row of a (students, sessions) matrix
+
+    Uses the closed form (n*Sxy - Sx*Sy) / (n*Sxx - Sx^2) with x = 0..n-1,
+    which matches np.polyfit(x, row, 1)[0] without building a Vandermonde
+    matrix per student.
+    """
+    n_rows, n = matrix.shape
+    sum_x = n * (n - 1) / 2.0
+    sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+    denom = n * sum_xx - sum_x * sum_x
+    out = np.empty(n_rows)
+    for row in prange(n_rows):
+        sum_y = 0.0
+        sum_xy = 0.0
+        for col in range(n):
+            sum_y += matrix[row, col]
+            sum_xy += col * matrix[row, col]
+        out[row] = (n * sum_xy - sum_x * sum_y) / denom
+    return out
+
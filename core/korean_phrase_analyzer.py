@@ -10,9 +10,23 @@ relative clauses, and complex sentence components.
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import atexit
+import hashlib
+import os
+import pickle
 import re
 from konlpy.tag import Okt
 
+# Distinct sentences whose analysis is kept per analyzer instance
+PHRASE_CACHE_SIZE = 1024
+
+# Optional on-disk cache shared between runs (see KoreanPhraseAnalyzer(cache_path=...)).
+# Bump the version whenever the phrase rules change so stale results are dropped.
+PHRASE_DISK_CACHE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 ".cache", "phrase_cache.pkl")
+PHRASE_DISK_CACHE_VERSION = 1
+
 class ComponentType(Enum):
     """Korean sentence component types (구 단위)"""
     SUBJECT = "주어구"          # Subject phrase: 도시 녹화는
@@ -51,8 +65,23 @@ class KoreanPhraseAnalyzer:
     한국어 구 단위 문법 분석기
     """
     
-    def __init__(self):
-        self.okt = Okt()
+    def __init__(self, cache_path: Optional[str] = None):
+        # Okt starts a JVM: created on first use, so fully cached runs never pay for it
+        self._okt = None
+        
+        # sha1(sentence) -> analyzed phrases, persisted to cache_path at exit
+        self._cache_path = cache_path
+        self._disk_cache: Dict[str, Tuple[PhraseUnit, ...]] = {}
+        self._disk_cache_dirty = False
+        if cache_path:
+            try:
+                with open(cache_path, 'rb') as f:
+                    version, cached = pickle.load(f)
+                if version == PHRASE_DISK_CACHE_VERSION:
+                    self._disk_cache = cached
+            except Exception:
+                pass
+            atexit.register(self.save_cache)
         
         # Korean particles by function (조사 체계)
         self.particles = {
@@ -78,13 +107,68 @@ class KoreanPhraseAnalyzer:
             'embedded': r'(\[.*?\])',                              # [그가 말한] 내용
         }
         
+        # Analysis is deterministic per sentence: keep recent results per instance
+        self._analyze_cached = lru_cache(maxsize=PHRASE_CACHE_SIZE)(self._analyze_phrase_structure)
+        
         print("✅ Korean Phrase Analyzer initialized")
     
+    @property
+    def okt(self) -> Okt:
+        if self._okt is None:
+            self._okt = Okt()
+        return self._okt
+    
+    def save_cache(self):
+        """Write the on-disk phrase cache if new sentences were analyzed"""
+        if not (self._cache_path and self._disk_cache_dirty):
+            return
+        # Merge with what is on disk now, in case another analyzer saved meanwhile
+        entries = {}
+        try:
+            with open(self._cache_path, 'rb') as f:
+                version, cached = pickle.load(f)
+            if version == PHRASE_DISK_CACHE_VERSION:
+                entries = cached
+        except Exception:
+            pass
+        entries.update(self._disk_cache)
+        
+        tmp_path = self._cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_path) or ".", exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((PHRASE_DISK_CACHE_VERSION, entries), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+            self._disk_cache_dirty = False
+        except OSError as e:
+            print(f"구 분석 캐시 저장 실패 {self._cache_path}: {e}")
+    
     def analyze_phrase_structure(self, sentence: str) -> List[PhraseUnit]:
         """
         Analyze Korean sentence into grammatically correct phrase units
         문장을 문법적으로 올바른 구 단위로 분석
+        
+        Results are cached by sentence text; the returned list is new on every
+        call but the PhraseUnit objects are shared, so treat them as read-only.
         """
+        return list(self._analyze_cached(sentence))
+    
+    def _analyze_phrase_structure(self, sentence: str) -> Tuple[PhraseUnit, ...]:
+        """Analysis behind analyze_phrase_structure (consults the disk cache if enabled)"""
+        if self._cache_path:
+            key = hashlib.sha1(sentence.encode('utf-8')).hexdigest()
+            cached = self._disk_cache.get(key)
+            if cached is not None:
+                return cached
+            phrases = self._analyze_sentence(sentence)
+            self._disk_cache[key] = phrases
+            self._disk_cache_dirty = True
+            return phrases
+        return self._analyze_sentence(sentence)
+    
+    def _analyze_sentence(self, sentence: str) -> Tuple[PhraseUnit, ...]:
+        """Run the full tokenize/boundary/classify pipeline on one sentence"""
         print(f"🔍 구 단위 분석 시작: {sentence}")
         
         # Step 1: Tokenize with POS tags
@@ -103,7 +187,7 @@ class KoreanPhraseAnalyzer:
         classified_phrases = self._classify_phrase_components(phrases)
         print(f"✅ 성분 분류 완료: {[(p.text, p.component_type.value) for p in classified_phrases]}")
         
-        return classified_phrases
+        return tuple(classified_phrases)
     
     def _identify_particles(self, tokens: List[Tuple[str, str]]) -> List[KoreanParticle]:
         """Identify Korean particles in the token sequence"""
@@ -4,41 +4,479 @@ Report Generator Module
 Generate comprehensive PDF/HTML reports with visualizations
 """
 
+import asyncio
+import gzip
 import json
 import os
+import threading
+from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from html import escape
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Any, Set
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
 import plotly.graph_objects as go
 import plotly.express as px
-from jinja2 import Template
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
 import base64
 from io import BytesIO
 
+try:
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.pdfgen import canvas
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+# Font for pages drawn with ReportLab: a built-in CID font with Hangul glyphs
+# (no font file required), or the standard Helvetica if it cannot be registered
+PDF_FONT = 'Helvetica'
+if REPORTLAB_AVAILABLE:
+    try:
+        pdfmetrics.registerFont(UnicodeCIDFont('HYSMyeongJo-Medium'))
+        PDF_FONT = 'HYSMyeongJo-Medium'
+    except Exception as e:
+        print(f"Korean PDF font unavailable, using {PDF_FONT}: {e}")
+
+
+# Korean display names for skill identifiers
+SKILL_TRANSLATIONS = {
+    'keyword_identification': '키워드 식별',
+    'center_sentence': '중심 문장 파악',
+    'center_paragraph': '중심 단락 파악',
+    'topic_comprehension': '주제 이해',
+    'vocabulary': '어휘력',
+    'inference': '추론 능력',
+    'summary': '요약 능력'
+}
+
+# Icons shown next to earned achievements
+ACHIEVEMENT_ICONS = {
+    '일주일 연속 학습': '🔥',
+    '첫 만점': '💯',
+    '10문제 연속 정답': '🎯',
+    '학습 마스터': '👑',
+    '빠른 학습자': '⚡',
+    '꾸준한 학습자': '📚'
+}
+
+# Static study strategy section appended to the PDF recommendations page
+STRATEGY_BLOCK = """
+
+【학습 전략】
+1. 약점 영역 집중 학습 (하루 30분)
+2. 강점 영역 심화 학습 (주 2회)
+3. 규칙적인 복습 스케줄 유지
+4. 다양한 난이도 문제 도전
+"""
+
+
+# HTML report templates
+_STUDENT_HTML_SRC = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>학습 분석 보고서 - {{ student_name }}</title>
+    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: 'Noto Sans KR', sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 20px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #2E86AB 0%, #6C91BF 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }
+        .header p {
+            font-size: 1.1em;
+            opacity: 0.9;
+        }
+        .content {
+            padding: 40px;
+        }
+        .section {
+            margin-bottom: 40px;
+        }
+        .section-title {
+            font-size: 1.8em;
+            color: #2E86AB;
+            margin-bottom: 20px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e0e0e0;
+        }
+        .metrics-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .metric-card {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+            transition: transform 0.3s;
+        }
+        .metric-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+        }
+        .metric-value {
+            font-size: 2em;
+            font-weight: bold;
+            color: #2E86AB;
+        }
+        .metric-label {
+            color: #666;
+            margin-top: 5px;
+        }
+        .chart-container {
+            margin: 30px 0;
+            padding: 20px;
+            background: #f8f9fa;
+            border-radius: 10px;
+        }
+        .skills-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+        }
+        .skills-table th,
+        .skills-table td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .skills-table th {
+            background: #f0f0f0;
+            font-weight: bold;
+        }
+        .skill-bar {
+            background: #e0e0e0;
+            height: 20px;
+            border-radius: 10px;
+            overflow: hidden;
+            position: relative;
+        }
+        .skill-progress {
+            height: 100%;
+            background: linear-gradient(90deg, #73AB84, #2E86AB);
+            border-radius: 10px;
+            transition: width 1s ease;
+        }
+        .recommendations {
+            background: #fff3cd;
+            border-left: 4px solid #F18F01;
+            padding: 20px;
+            border-radius: 5px;
+            margin-top: 20px;
+        }
+        .recommendations h3 {
+            color: #F18F01;
+            margin-bottom: 10px;
+        }
+        .recommendations ul {
+            list-style-position: inside;
+            color: #666;
+        }
+        .footer {
+            background: #f8f9fa;
+            padding: 20px;
+            text-align: center;
+            color: #666;
+            font-size: 0.9em;
+        }
+        .badge {
+            display: inline-block;
+            padding: 5px 10px;
+            border-radius: 15px;
+            font-size: 0.9em;
+            margin: 5px;
+        }
+        .badge-success {
+            background: #d4edda;
+            color: #155724;
+        }
+        .badge-warning {
+            background: #fff3cd;
+            color: #856404;
+        }
+        .badge-danger {
+            background: #f8d7da;
+            color: #721c24;
+        }
+        @media (max-width: 768px) {
+            .metrics-grid {
+                grid-template-columns: 1fr;
+            }
+            .header h1 {
+                font-size: 1.8em;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>학습 분석 보고서</h1>
+            <p>{{ student_name }} | {{ report_date }}</p>
+        </div>
+        
+        <div class="content">
+            <!-- Performance Overview -->
+            <div class="section">
+                <h2 class="section-title">📊 전체 성과 요약</h2>
+                <div class="metrics-grid">
+                    <div class="metric-card">
+                        <div class="metric-value">{{ overall_accuracy }}%</div>
+                        <div class="metric-label">전체 정답률</div>
+                    </div>
+                    <div class="metric-card">
+                        <div class="metric-value">{{ total_sessions }}</div>
+                        <div class="metric-label">학습 세션</div>
+                    </div>
+                    <div class="metric-card">
+                        <div class="metric-value">{{ total_time }}시간</div>
+                        <div class="metric-label">총 학습 시간</div>
+                    </div>
+                    <div class="metric-card">
+                        <div class="metric-value">{{ current_streak }}일</div>
+                        <div class="metric-label">연속 학습</div>
+                    </div>
+                </div>
+            </div>
+            
+            <!-- Skill Analysis -->
+            <div class="section">
+                <h2 class="section-title">🎯 영역별 실력 분석</h2>
+                <table class="skills-table">
+                    <thead>
+                        <tr>
+                            <th>영역</th>
+                            <th>현재 수준</th>
+                            <th>진행 상황</th>
+                            <th>상태</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {% for skill in skills %}
+                        <tr>
+                            <td>{{ skill.name }}</td>
+                            <td>{{ skill.level }}%</td>
+                            <td>
+                                <div class="skill-bar">
+                                    <div class="skill-progress" style="width: {{ skill.level }}%"></div>
+                                </div>
+                            </td>
+                            <td>
+                                {% if skill.trend == 'improving' %}
+                                <span class="badge badge-success">↑ 향상중</span>
+                                {% elif skill.trend == 'declining' %}
+                                <span class="badge badge-danger">↓ 하락중</span>
+                                {% else %}
+                                <span class="badge badge-warning">→ 유지중</span>
+                                {% endif %}
+                            </td>
+                        </tr>
+                        {% endfor %}
+                    </tbody>
+                </table>
+            </div>
+            
+            <!-- Progress Charts -->
+            <div class="section">
+                <h2 class="section-title">📈 학습 진도 차트</h2>
+                <div class="chart-container">
+                    <div id="progress-chart"></div>
+                </div>
+                <div class="chart-container">
+                    <div id="skill-radar"></div>
+                </div>
+            </div>
+            
+            <!-- Learning Patterns -->
+            <div class="section">
+                <h2 class="section-title">🔍 학습 패턴 분석</h2>
+                <div class="chart-container">
+                    <div id="time-pattern-chart"></div>
+                </div>
+                <div class="chart-container">
+                    <div id="accuracy-trend-chart"></div>
+                </div>
+            </div>
+            
+            <!-- Recommendations -->
+            <div class="section">
+                <h2 class="section-title">💡 맞춤형 학습 권장사항</h2>
+                <div class="recommendations">
+                    <h3>개선이 필요한 영역</h3>
+                    <ul>
+                        {% for rec in weaknesses %}
+                        <li>{{ rec }}</li>
+                        {% endfor %}
+                    </ul>
+                </div>
+                <div class="recommendations" style="background: #d4edda; border-color: #73AB84;">
+                    <h3 style="color: #155724;">강점 영역</h3>
+                    <ul>
+                        {% for strength in strengths %}
+                        <li>{{ strength }}</li>
+                        {% endfor %}
+                    </ul>
+                </div>
+            </div>
+            
+            <!-- Achievements -->
+            <div class="section">
+                <h2 class="section-title">🏆 획득한 성취</h2>
+                <div class="metrics-grid">
+                    {% for achievement in achievements %}
+                    <div class="metric-card">
+                        <div style="font-size: 3em;">{{ achievement.icon }}</div>
+                        <div class="metric-label">{{ achievement.name }}</div>
+                    </div>
+                    {% endfor %}
+                </div>
+            </div>
+        </div>
+        
+        <div class="footer">
+            <p>생성일: {{ report_date }} | Korean Reading Comprehension Learning Analytics System</p>
+        </div>
+    </div>
+    
+    <script>
+        {{ chart_scripts }}
+    </script>
+</body>
+</html>
+"""
+
+# Class report has no loops/conditionals; its str.format slots are compiled
+# into a plain f-string function (see _compile_renderer)
+_CLASS_HTML = """
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>학급 분석 보고서</title>
+    <style>
+        body {{ font-family: 'Noto Sans KR', sans-serif; padding: 20px; }}
+        .header {{ text-align: center; padding: 20px; background: #2E86AB; color: white; }}
+        .content {{ max-width: 1200px; margin: 0 auto; padding: 20px; }}
+        .metric {{ display: inline-block; padding: 20px; margin: 10px; background: #f0f0f0; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>학급 분석 보고서</h1>
+        <p>{class_id} | {report_date}</p>
+    </div>
+    <div class="content">
+        <h2>학급 통계</h2>
+        <div class="metric">
+            <h3>{total_students}</h3>
+            <p>전체 학생</p>
+        </div>
+        <div class="metric">
+            <h3>{avg_accuracy}%</h3>
+            <p>평균 정답률</p>
+        </div>
+        <div class="metric">
+            <h3>{active_students}</h3>
+            <p>활동 학생</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Shared environment for all report templates; compiled bytecode is persisted
+# to the user temp dir so worker restarts skip template compilation
+_REPORT_ENV = Environment(
+    loader=DictLoader({
+        'student': _STUDENT_HTML_SRC,
+    }),
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+
+def _compile_renderer(template: str) -> Callable[..., str]:
+    """Compile a str.format template into a function returning an f-string"""
+    fields = list(dict.fromkeys(
+        name for _, name, _, _ in Formatter().parse(template) if name
+    ))
+    src = f"def _render({', '.join(fields)}):\n    return f{template!r}\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, '<report template>', 'exec'), namespace)
+    return namespace['_render']
+
 
 class ReportGenerator:
     """Generate visual reports for learning analytics"""
     
+    # Output roots whose directory tree has already been created
+    _DIRS_READY: Set[str] = set()
+    
+    # Template environment shared by every generator instance
+    _env = _REPORT_ENV
+    
+    # Comparison chart figure, created on first use and redrawn in place
+    _comparison_fig: Optional[Figure] = None
+    
+    # Guards matplotlib state when PDFs are rendered from worker threads
+    _pdf_lock = threading.Lock()
+    
+    # Specialized class report renderer, generated on first construction
+    _render_class: Optional[Callable[..., str]] = None
+    
     def __init__(self, output_dir: str = "./reports"):
+        if ReportGenerator._render_class is None:
+            ReportGenerator._render_class = staticmethod(_compile_renderer(_CLASS_HTML))
         self.output_dir = output_dir
         self.ensure_directories()
         self.setup_styles()
         
     def ensure_directories(self):
-        """Create necessary directories"""
-        dirs = [
-            self.output_dir,
-            os.path.join(self.output_dir, "pdf"),
-            os.path.join(self.output_dir, "html"),
-            os.path.join(self.output_dir, "charts"),
-            os.path.join(self.output_dir, "data")
-        ]
-        for dir_path in dirs:
-            os.makedirs(dir_path, exist_ok=True)
+        """Create necessary directories (once per output root)"""
+        if self.output_dir in ReportGenerator._DIRS_READY:
+            return
+        root = Path(self.output_dir)
+        for sub in ("pdf", "html", "charts", "data"):
+            root.joinpath(sub).mkdir(parents=True, exist_ok=True)
+        ReportGenerator._DIRS_READY.add(self.output_dir)
     
     def setup_styles(self):
         """Setup visualization styles"""
@@ -56,13 +494,15 @@ class ReportGenerator:
     
     def generate_student_report(self, 
                                student_data: Dict,
-                               format: str = 'html') -> str:
+                               format: str = 'html',
+                               compress: bool = False) -> str:
         """
         Generate individual student report
         
         Args:
             student_data: Dictionary containing student metrics and progress
             format: Output format ('html' or 'pdf')
+            compress: Write HTML reports gzip-compressed (.html.gz)
             
         Returns:
             Path to generated report
@@ -71,338 +511,47 @@ class ReportGenerator:
         student_id = student_data.get('student_id', 'unknown')
         
         if format == 'html':
-            return self._generate_html_student_report(student_data, timestamp)
+            return self._generate_html_student_report(student_data, timestamp, compress)
         elif format == 'pdf':
             return self._generate_pdf_student_report(student_data, timestamp)
         else:
             raise ValueError(f"Unsupported format: {format}")
     
-    def _generate_html_student_report(self, data: Dict, timestamp: str) -> str:
+    def _generate_html_student_report(self, data: Dict, timestamp: str,
+                                      compress: bool = False) -> str:
         """Generate HTML report for student"""
         student_id = data.get('student_id', 'unknown')
         
         # Create visualizations
         charts = self._create_student_charts(data)
         
-        # HTML template
-        html_template = """
-        <!DOCTYPE html>
-        <html lang="ko">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>학습 분석 보고서 - {{ student_name }}</title>
-            <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-            <style>
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }
-                body {
-                    font-family: 'Noto Sans KR', sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    padding: 20px;
-                }
-                .container {
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background: white;
-                    border-radius: 20px;
-                    box-shadow: 0 20px 60px rgba(0,0,0,0.1);
-                    overflow: hidden;
-                }
-                .header {
-                    background: linear-gradient(135deg, #2E86AB 0%, #6C91BF 100%);
-                    color: white;
-                    padding: 40px;
-                    text-align: center;
-                }
-                .header h1 {
-                    font-size: 2.5em;
-                    margin-bottom: 10px;
-                }
-                .header p {
-                    font-size: 1.1em;
-                    opacity: 0.9;
-                }
-                .content {
-                    padding: 40px;
-                }
-                .section {
-                    margin-bottom: 40px;
-                }
-                .section-title {
-                    font-size: 1.8em;
-                    color: #2E86AB;
-                    margin-bottom: 20px;
-                    padding-bottom: 10px;
-                    border-bottom: 2px solid #e0e0e0;
-                }
-                .metrics-grid {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }
-                .metric-card {
-                    background: #f8f9fa;
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                    transition: transform 0.3s;
-                }
-                .metric-card:hover {
-                    transform: translateY(-5px);
-                    box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-                }
-                .metric-value {
-                    font-size: 2em;
-                    font-weight: bold;
-                    color: #2E86AB;
-                }
-                .metric-label {
-                    color: #666;
-                    margin-top: 5px;
-                }
-                .chart-container {
-                    margin: 30px 0;
-                    padding: 20px;
-                    background: #f8f9fa;
-                    border-radius: 10px;
-                }
-                .skills-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-top: 20px;
-                }
-                .skills-table th,
-                .skills-table td {
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #e0e0e0;
-                }
-                .skills-table th {
-                    background: #f0f0f0;
-                    font-weight: bold;
-                }
-                .skill-bar {
-                    background: #e0e0e0;
-                    height: 20px;
-                    border-radius: 10px;
-                    overflow: hidden;
-                    position: relative;
-                }
-                .skill-progress {
-                    height: 100%;
-                    background: linear-gradient(90deg, #73AB84, #2E86AB);
-                    border-radius: 10px;
-                    transition: width 1s ease;
-                }
-                .recommendations {
-                    background: #fff3cd;
-                    border-left: 4px solid #F18F01;
-                    padding: 20px;
-                    border-radius: 5px;
-                    margin-top: 20px;
-                }
-                .recommendations h3 {
-                    color: #F18F01;
-                    margin-bottom: 10px;
-                }
-                .recommendations ul {
-                    list-style-position: inside;
-                    color: #666;
-                }
-                .footer {
-                    background: #f8f9fa;
-                    padding: 20px;
-                    text-align: center;
-                    color: #666;
-                    font-size: 0.9em;
-                }
-                .badge {
-                    display: inline-block;
-                    padding: 5px 10px;
-                    border-radius: 15px;
-                    font-size: 0.9em;
-                    margin: 5px;
-                }
-                .badge-success {
-                    background: #d4edda;
-                    color: #155724;
-                }
-                .badge-warning {
-                    background: #fff3cd;
-                    color: #856404;
-                }
-                .badge-danger {
-                    background: #f8d7da;
-                    color: #721c24;
-                }
-                @media (max-width: 768px) {
-                    .metrics-grid {
-                        grid-template-columns: 1fr;
-                    }
-                    .header h1 {
-                        font-size: 1.8em;
-                    }
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>학습 분석 보고서</h1>
-                    <p>{{ student_name }} | {{ report_date }}</p>
-                </div>
-                
-                <div class="content">
-                    <!-- Performance Overview -->
-                    <div class="section">
-                        <h2 class="section-title">📊 전체 성과 요약</h2>
-                        <div class="metrics-grid">
-                            <div class="metric-card">
-                                <div class="metric-value">{{ overall_accuracy }}%</div>
-                                <div class="metric-label">전체 정답률</div>
-                            </div>
-                            <div class="metric-card">
-                                <div class="metric-value">{{ total_sessions }}</div>
-                                <div class="metric-label">학습 세션</div>
-                            </div>
-                            <div class="metric-card">
-                                <div class="metric-value">{{ total_time }}시간</div>
-                                <div class="metric-label">총 학습 시간</div>
-                            </div>
-                            <div class="metric-card">
-                                <div class="metric-value">{{ current_streak }}일</div>
-                                <div class="metric-label">연속 학습</div>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Skill Analysis -->
-                    <div class="section">
-                        <h2 class="section-title">🎯 영역별 실력 분석</h2>
-                        <table class="skills-table">
-                            <thead>
-                                <tr>
-                                    <th>영역</th>
-                                    <th>현재 수준</th>
-                                    <th>진행 상황</th>
-                                    <th>상태</th>
-                                </tr>
-                            </thead>
-                            <tbody>
-                                {% for skill in skills %}
-                                <tr>
-                                    <td>{{ skill.name }}</td>
-                                    <td>{{ skill.level }}%</td>
-                                    <td>
-                                        <div class="skill-bar">
-                                            <div class="skill-progress" style="width: {{ skill.level }}%"></div>
-                                        </div>
-                                    </td>
-                                    <td>
-                                        {% if skill.trend == 'improving' %}
-                                        <span class="badge badge-success">↑ 향상중</span>
-                                        {% elif skill.trend == 'declining' %}
-                                        <span class="badge badge-danger">↓ 하락중</span>
-                                        {% else %}
-                                        <span class="badge badge-warning">→ 유지중</span>
-                                        {% endif %}
-                                    </td>
-                                </tr>
-                                {% endfor %}
-                            </tbody>
-                        </table>
-                    </div>
-                    
-                    <!-- Progress Charts -->
-                    <div class="section">
-                        <h2 class="section-title">📈 학습 진도 차트</h2>
-                        <div class="chart-container">
-                            <div id="progress-chart"></div>
-                        </div>
-                        <div class="chart-container">
-                            <div id="skill-radar"></div>
-                        </div>
-                    </div>
-                    
-                    <!-- Learning Patterns -->
-                    <div class="section">
-                        <h2 class="section-title">🔍 학습 패턴 분석</h2>
-                        <div class="chart-container">
-                            <div id="time-pattern-chart"></div>
-                        </div>
-                        <div class="chart-container">
-                            <div id="accuracy-trend-chart"></div>
-                        </div>
-                    </div>
-                    
-                    <!-- Recommendations -->
-                    <div class="section">
-                        <h2 class="section-title">💡 맞춤형 학습 권장사항</h2>
-                        <div class="recommendations">
-                            <h3>개선이 필요한 영역</h3>
-                            <ul>
-                                {% for rec in weaknesses %}
-                                <li>{{ rec }}</li>
-                                {% endfor %}
-                            </ul>
-                        </div>
-                        <div class="recommendations" style="background: #d4edda; border-color: #73AB84;">
-                            <h3 style="color: #155724;">강점 영역</h3>
-                            <ul>
-                                {% for strength in strengths %}
-                                <li>{{ strength }}</li>
-                                {% endfor %}
-                            </ul>
-                        </div>
-                    </div>
-                    
-                    <!-- Achievements -->
-                    <div class="section">
-                        <h2 class="section-title">🏆 획득한 성취</h2>
-                        <div class="metrics-grid">
-                            {% for achievement in achievements %}
-                            <div class="metric-card">
-                                <div style="font-size: 3em;">{{ achievement.icon }}</div>
-                                <div class="metric-label">{{ achievement.name }}</div>
-                            </div>
-                            {% endfor %}
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="footer">
-                    <p>생성일: {{ report_date }} | Korean Reading Comprehension Learning Analytics System</p>
-                </div>
-            </div>
-            
-            <script>
-                {{ chart_scripts }}
-            </script>
-        </body>
-        </html>
-        """
-        
         # Prepare template data
         template_data = self._prepare_template_data(data)
         template_data['chart_scripts'] = charts['scripts']
         
         # Render template
-        template = Template(html_template)
-        html_content = template.render(**template_data)
+        html_content = self._env.get_template('student').render(**template_data)
         
         # Save report
         filepath = os.path.join(self.output_dir, 'html', f'student_{student_id}_{timestamp}.html')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
+        return self._write_html(filepath, html_content, compress)
+    
+    def _write_html(self, filepath: str, html_content: str, compress: bool = False) -> str:
+        """Write rendered HTML to disk, optionally gzip-compressed"""
+        if compress:
+            filepath += '.gz'
+            with gzip.open(filepath, 'wt', encoding='utf-8', compresslevel=3) as f:
+                f.write(html_content)
+        else:
+            # Encode once and hand the bytes to the kernel directly, bypassing
+            # the text/buffer layers of a regular file object
+            view = memoryview(html_content.encode('utf-8'))
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
         return filepath
     
     def _prepare_template_data(self, data: Dict) -> Dict:
@@ -411,22 +560,22 @@ class ReportGenerator:
         profile = data.get('profile', {})
         
         # Process skills data
-        skills = []
-        skill_levels = metrics.get('skill_levels', {})
-        for skill_name, level in skill_levels.items():
-            skills.append({
-                'name': self._translate_skill_name(skill_name),
+        translate = SKILL_TRANSLATIONS.get
+        skills = [
+            {
+                'name': translate(skill_name, skill_name),
                 'level': round(level, 1),
                 'trend': self._determine_trend(data, skill_name)
-            })
+            }
+            for skill_name, level in metrics.get('skill_levels', {}).items()
+        ]
         
         # Process achievements
-        achievements = []
-        for achievement in metrics.get('achievements', []):
-            achievements.append({
-                'icon': self._get_achievement_icon(achievement),
-                'name': achievement
-            })
+        icon_for = ACHIEVEMENT_ICONS.get
+        achievements = [
+            {'icon': icon_for(achievement, '🌟'), 'name': achievement}
+            for achievement in metrics.get('achievements', [])
+        ]
         
         # Add default achievements if none
         if not achievements:
@@ -451,16 +600,7 @@ class ReportGenerator:
     
     def _translate_skill_name(self, skill_name: str) -> str:
         """Translate skill names to Korean"""
-        translations = {
-            'keyword_identification': '키워드 식별',
-            'center_sentence': '중심 문장 파악',
-            'center_paragraph': '중심 단락 파악',
-            'topic_comprehension': '주제 이해',
-            'vocabulary': '어휘력',
-            'inference': '추론 능력',
-            'summary': '요약 능력'
-        }
-        return translations.get(skill_name, skill_name)
+        return SKILL_TRANSLATIONS.get(skill_name, skill_name)
     
     def _determine_trend(self, data: Dict, skill_name: str) -> str:
         """Determine skill trend"""
@@ -469,15 +609,7 @@ class ReportGenerator:
     
     def _get_achievement_icon(self, achievement: str) -> str:
         """Get icon for achievement"""
-        icons = {
-            '일주일 연속 학습': '🔥',
-            '첫 만점': '💯',
-            '10문제 연속 정답': '🎯',
-            '학습 마스터': '👑',
-            '빠른 학습자': '⚡',
-            '꾸준한 학습자': '📚'
-        }
-        return icons.get(achievement, '🌟')
+        return ACHIEVEMENT_ICONS.get(achievement, '🌟')
     
     def _create_student_charts(self, data: Dict) -> Dict:
         """Create interactive charts for student report"""
@@ -542,7 +674,7 @@ class ReportGenerator:
         var radarData = {{
             type: 'scatterpolar',
             r: {skill_values},
-            theta: {[self._translate_skill_name(s) for s in skill_names]},
+            theta: {[SKILL_TRANSLATIONS.get(s, s) for s in skill_names]},
             fill: 'toself',
             name: '현재 실력',
             line: {{color: '#2E86AB'}},
@@ -693,7 +825,7 @@ class ReportGenerator:
         if skills:
             # Create bar chart
             ax = fig.add_subplot(211)
-            skill_names = [self._translate_skill_name(s) for s in skills.keys()]
+            skill_names = [SKILL_TRANSLATIONS.get(s, s) for s in skills.keys()]
             skill_values = list(skills.values())
             
             bars = ax.bar(skill_names, skill_values, color=self.color_palette['primary'])
@@ -762,27 +894,15 @@ class ReportGenerator:
         
         metrics = data.get('metrics', {})
         
-        recommendations_text = """
-        【강점 영역】
-        """
-        for strength in metrics.get('strengths', ['계속 노력하세요!']):
-            recommendations_text += f"  ✓ {strength}\n"
-        
-        recommendations_text += """
-        
-        【개선 필요 영역】
-        """
-        for weakness in metrics.get('weaknesses', ['추가 데이터 필요']):
-            recommendations_text += f"  ⚠ {weakness}\n"
-        
-        recommendations_text += """
-        
-        【학습 전략】
-        1. 약점 영역 집중 학습 (하루 30분)
-        2. 강점 영역 심화 학습 (주 2회)
-        3. 규칙적인 복습 스케줄 유지
-        4. 다양한 난이도 문제 도전
-        """
+        strengths = metrics.get('strengths', ['계속 노력하세요!'])
+        weaknesses = metrics.get('weaknesses', ['추가 데이터 필요'])
+        recommendations_text = (
+            "【강점 영역】\n"
+            + "\n".join(f"  ✓ {strength}" for strength in strengths)
+            + "\n\n【개선 필요 영역】\n"
+            + "\n".join(f"  ⚠ {weakness}" for weakness in weaknesses)
+            + STRATEGY_BLOCK
+        )
         
         ax.text(0.1, 0.9, recommendations_text, transform=ax.transAxes,
                 fontsize=11, verticalalignment='top')
@@ -805,47 +925,8 @@ class ReportGenerator:
         """Generate HTML report for class"""
         class_id = data.get('class_id', 'unknown')
         
-        # Simplified HTML template for class report
-        html_template = """
-        <!DOCTYPE html>
-        <html lang="ko">
-        <head>
-            <meta charset="UTF-8">
-            <title>학급 분석 보고서</title>
-            <style>
-                body { font-family: 'Noto Sans KR', sans-serif; padding: 20px; }
-                .header { text-align: center; padding: 20px; background: #2E86AB; color: white; }
-                .content { max-width: 1200px; margin: 0 auto; padding: 20px; }
-                .metric { display: inline-block; padding: 20px; margin: 10px; background: #f0f0f0; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>학급 분석 보고서</h1>
-                <p>{{ class_id }} | {{ report_date }}</p>
-            </div>
-            <div class="content">
-                <h2>학급 통계</h2>
-                <div class="metric">
-                    <h3>{{ total_students }}</h3>
-                    <p>전체 학생</p>
-                </div>
-                <div class="metric">
-                    <h3>{{ avg_accuracy }}%</h3>
-                    <p>평균 정답률</p>
-                </div>
-                <div class="metric">
-                    <h3>{{ active_students }}</h3>
-                    <p>활동 학생</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        template = Template(html_template)
-        html_content = template.render(
-            class_id=class_id,
+        html_content = self._render_class(
+            class_id=escape(str(class_id)),
             report_date=datetime.now().strftime('%Y년 %m월 %d일'),
             total_students=data.get('total_students', 0),
             avg_accuracy=round(data.get('avg_accuracy', 0) * 100, 1),
@@ -853,16 +934,38 @@ class ReportGenerator:
         )
         
         filepath = os.path.join(self.output_dir, 'html', f'class_{class_id}_{timestamp}.html')
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return filepath
+        return self._write_html(filepath, html_content)
     
     def _generate_pdf_class_report(self, data: Dict, timestamp: str) -> str:
         """Generate PDF report for class"""
         class_id = data.get('class_id', 'unknown')
         filepath = os.path.join(self.output_dir, 'pdf', f'class_{class_id}_{timestamp}.pdf')
         
+        lines = [
+            f"학급 ID: {class_id}",
+            f"보고서 생성일: {datetime.now().strftime('%Y년 %m월 %d일')}",
+            "",
+            f"전체 학생 수: {data.get('total_students', 0)}명",
+            f"활동 학생 수: {data.get('active_students', 0)}명",
+            f"평균 정답률: {data.get('avg_accuracy', 0) * 100:.1f}%",
+            f"표준 편차: {data.get('std_deviation', 0):.2f}"
+        ]
+        
+        if REPORTLAB_AVAILABLE:
+            # Text-only page: draw directly instead of building a matplotlib figure
+            width, height = landscape(letter)
+            c = canvas.Canvas(filepath, pagesize=(width, height))
+            c.setFont(PDF_FONT, 16)
+            c.drawCentredString(width / 2, height - 50, f'학급 분석 보고서 - {class_id}')
+            text = c.beginText(80, height - 110)
+            text.setFont(PDF_FONT, 12)
+            text.setLeading(20)
+            for line in lines:
+                text.textLine(line)
+            c.drawText(text)
+            c.save()
+            return filepath
+        
         with PdfPages(filepath) as pdf:
             fig = plt.figure(figsize=(11, 8.5))
             fig.suptitle(f'학급 분석 보고서 - {class_id}', fontsize=16, fontweight='bold')
@@ -871,17 +974,7 @@ class ReportGenerator:
             ax = fig.add_subplot(111)
             ax.axis('off')
             
-            text = f"""
-            학급 ID: {class_id}
-            보고서 생성일: {datetime.now().strftime('%Y년 %m월 %d일')}
-            
-            전체 학생 수: {data.get('total_students', 0)}명
-            활동 학생 수: {data.get('active_students', 0)}명
-            평균 정답률: {data.get('avg_accuracy', 0) * 100:.1f}%
-            표준 편차: {data.get('std_deviation', 0):.2f}
-            """
-            
-            ax.text(0.1, 0.9, text, transform=ax.transAxes, fontsize=12,
+            ax.text(0.1, 0.9, "\n".join(lines), transform=ax.transAxes, fontsize=12,
                    verticalalignment='top', fontfamily='monospace')
             
             pdf.savefig(fig)
@@ -900,12 +993,47 @@ class ReportGenerator:
             # Create comparison charts
             comparison_html = self._create_comparison_html(student_ids, data)
             filepath = os.path.join(self.output_dir, 'html', f'comparison_{timestamp}.html')
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(comparison_html)
-            return filepath
+            return self._write_html(filepath, comparison_html)
         else:
             return self._create_comparison_pdf(student_ids, data, timestamp)
     
+    # Async entry points for use from event-loop code (e.g. FastAPI handlers).
+    # Rendering and file writes run in a worker thread; PDF rendering is
+    # serialized because matplotlib figure state is not thread-safe.
+    
+    async def generate_student_report_async(self,
+                                            student_data: Dict,
+                                            format: str = 'html',
+                                            compress: bool = False) -> str:
+        """Generate individual student report without blocking the event loop"""
+        return await self._run_blocking(format, self.generate_student_report,
+                                        student_data, format, compress)
+    
+    async def generate_class_report_async(self,
+                                          class_data: Dict,
+                                          format: str = 'html') -> str:
+        """Generate class-level report without blocking the event loop"""
+        return await self._run_blocking(format, self.generate_class_report,
+                                        class_data, format)
+    
+    async def generate_comparative_report_async(self,
+                                                student_ids: List[str],
+                                                data: Dict[str, Dict],
+                                                format: str = 'html') -> str:
+        """Generate comparative report without blocking the event loop"""
+        return await self._run_blocking(format, self.generate_comparative_report,
+                                        student_ids, data, format)
+    
+    async def _run_blocking(self, format: str, func, *args) -> str:
+        """Run a report generator in a worker thread"""
+        if format == 'pdf':
+            return await asyncio.to_thread(self._with_pdf_lock, func, *args)
+        return await asyncio.to_thread(func, *args)
+    
+    def _with_pdf_lock(self, func, *args) -> str:
+        with ReportGenerator._pdf_lock:
+            return func(*args)
+    
     def _create_comparison_html(self, student_ids: List[str], data: Dict[str, Dict]) -> str:
         """Create HTML comparison report"""
         html = """
@@ -914,14 +1042,10 @@ class ReportGenerator:
         <head>
             <meta charset="UTF-8">
             <title>학생 비교 분석</title>
-            <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
         </head>
         <body>
             <h1>학생 비교 분석 보고서</h1>
             <div id="comparison-chart"></div>
-            <script>
-                // Comparison chart would be generated here
-            </script>
         </body>
         </html>
         """
@@ -931,13 +1055,18 @@ class ReportGenerator:
         """Create PDF comparison report"""
         filepath = os.path.join(self.output_dir, 'pdf', f'comparison_{timestamp}.pdf')
         
+        # Reuse one figure across calls instead of constructing a new one
+        if ReportGenerator._comparison_fig is None:
+            fig = Figure(figsize=(11, 8.5))
+            fig.add_subplot(111)
+            ReportGenerator._comparison_fig = fig
+        fig = ReportGenerator._comparison_fig
+        ax = fig.axes[0]
+        ax.clear()
+        
         with PdfPages(filepath) as pdf:
-            fig = plt.figure(figsize=(11, 8.5))
             fig.suptitle('학생 비교 분석', fontsize=16, fontweight='bold')
             
-            # Create comparison visualizations
-            ax = fig.add_subplot(111)
-            
             # Sample comparison bar chart
             students = student_ids[:5]  # Limit to 5 students
             accuracies = [data.get(sid, {}).get('metrics', {}).get('accuracy', 0) * 100 for sid in students]
@@ -948,7 +1077,6 @@ class ReportGenerator:
             ax.grid(True, alpha=0.3)
             
             pdf.savefig(fig)
-            plt.close()
         
         return filepath
 
@@ -8,8 +8,18 @@ import json
 import os
 import random
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Number of threads used to read task files at startup
+LOAD_WORKERS = 16
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key'
 
@@ -17,27 +27,40 @@ class SimpleLearningSystem:
     def __init__(self):
         self.task_dir = "generator/out"
         self.tasks = self.load_tasks()
+        self.tasks_by_id = {task['id']: task for task in self.tasks}
+        self._task_pool = tuple(self.tasks)
+        # Target topic words per task, kept off the task dicts so they stay
+        # JSON-serializable for get_task
+        self.topic_words_by_id = {
+            task['id']: frozenset(task['q_topic_free']['target_topic'].split())
+            for task in self.tasks if 'q_topic_free' in task
+        }
+        self._rng = random.Random(os.urandom(8))
         
     def load_tasks(self):
         """Load all JSON task files"""
-        tasks = []
         json_files = glob.glob(os.path.join(self.task_dir, "*.json"))
         
-        for file_path in json_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    task = json.load(f)
-                    task['file_path'] = file_path
-                    tasks.append(task)
-            except Exception as e:
-                print(f"Failed to load {file_path}: {e}")
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            tasks = [task for task in executor.map(self._load_one, json_files) if task is not None]
         
         print(f"Loaded {len(tasks)} tasks")
         return tasks
     
+    def _load_one(self, file_path):
+        """Load a single JSON task file, or None if it cannot be parsed"""
+        try:
+            with open(file_path, 'rb') as f:
+                task = _loads(f.read())
+            task['file_path'] = file_path
+            return task
+        except Exception as e:
+            print(f"Failed to load {file_path}: {e}")
+            return None
+    
     def get_random_task(self):
         """Get a random task"""
-        return random.choice(self.tasks) if self.tasks else None
+        return self._rng.choice(self._task_pool) if self._task_pool else None
 
 learning_system = SimpleLearningSystem()
 
@@ -61,11 +84,10 @@ def get_task():
     task = learning_system.get_random_task()
     
     if task:
-        # Initialize session tracking
+        # Initialize session tracking; score/total are only written on
+        # submission so repeat fetches don't re-sign the session cookie
         if 'user_id' not in session:
             session['user_id'] = os.urandom(16).hex()
-            session['score'] = 0
-            session['total'] = 0
         
         return jsonify({'success': True, 'task': task})
     
@@ -80,11 +102,7 @@ def submit_answer():
     answer = data.get('answer')
     
     # Find the task
-    current_task = None
-    for task in learning_system.tasks:
-        if task['id'] == task_id:
-            current_task = task
-            break
+    current_task = learning_system.tasks_by_id.get(task_id)
     
     if not current_task:
         return jsonify({'success': False, 'message': 'Task not found'})
@@ -111,9 +129,10 @@ def submit_answer():
         
     elif question_type == 'topic':
         q = current_task['q_topic_free']
-        # Simple keyword matching
+        # Simple keyword matching (substring, so word + particle still counts)
         target = q['target_topic']
-        score = 0.7 if any(word in answer for word in target.split()) else 0.3
+        topic_words = learning_system.topic_words_by_id[task_id]
+        score = 0.7 if any(word in answer for word in topic_words) else 0.3
         correct = score >= 0.68
         feedback = f"모범답안: {target}"
     
@@ -159,9 +178,24 @@ def get_analytics():
         }
     })
 
+# ASGI entry point so the app can run under uvicorn/gunicorn worker processes
+# (asgiref/uvicorn are production-only dependencies, see requirements-prod.txt)
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    asgi_app = None
+
 if __name__ == '__main__':
     print(f"Starting Korean Reading Comprehension System")
     print(f"Tasks loaded: {len(learning_system.tasks)}")
     if learning_system.tasks:
         print("Sample task IDs:", [t['id'] for t in learning_system.tasks[:3]])
-    app.run(host='0.0.0.0', port=8080, debug=True)
\ No newline at end of file
+    try:
+        import uvicorn
+    except ImportError:
+        uvicorn = None
+    if uvicorn is not None and asgi_app is not None:
+        uvicorn.run("simple_web:asgi_app", host='0.0.0.0', port=8080, workers=os.cpu_count())
+    else:
+        app.run(host='0.0.0.0', port=8080, debug=True)
\ No newline at end of file
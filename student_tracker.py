@@ -4,15 +4,281 @@ Student Tracker Module
 Individual student progress tracking and personalized learning path generation
 """
 
+import csv
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from datetime import date, datetime, timedelta
+from typing import Callable, ClassVar, Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
-import pandas as pd
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, deque
+import atexit
+import bisect
 import pickle
+import queue
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from _tracker_kernels import batch_ema, batch_slope, focus_score
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def encode_json(data: Any) -> bytes:
+        """Serialize a record as an indented UTF-8 JSON document"""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+    
+    def encode_json_line(data: Any) -> bytes:
+        """Serialize a record as one compact JSON line (for append-only logs)"""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    
+    decode_json = orjson.loads
+else:
+    def encode_json(data: Any) -> bytes:
+        """Serialize a record as an indented UTF-8 JSON document"""
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    def encode_json_line(data: Any) -> bytes:
+        """Serialize a record as one compact JSON line (for append-only logs)"""
+        return json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n'
+    
+    decode_json = json.loads
+
+
+class BatchFileWriter:
+    """Background writer that serializes and writes small files in batches
+    
+    Callers enqueue a record with the path and encoder to use and return
+    immediately. A daemon thread drains up to ``max_batch`` pending records
+    per wake-up and encodes them on that same thread (no executor, so the
+    atexit flush still works after concurrent.futures has shut down). It then
+    keeps only the newest payload for each path (appends are concatenated)
+    and writes the batch in one pass.
+    """
+    
+    def __init__(self, max_batch: int = 32, max_pending: int = 1024):
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[str, Any, bool, Optional[Callable[[Any], bytes]]]]" = \
+            queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, path: str, data: Any, encode: Optional[Callable[[Any], bytes]] = None):
+        """Queue a file write (replaces the file contents)
+        
+        Args:
+            path: Destination file
+            data: Bytes, or a record to be serialized with ``encode``
+            encode: Serializer run on the writer side; None if ``data`` is bytes
+        """
+        self._put(path, data, False, encode)
+    
+    def append(self, path: str, data: Any, encode: Optional[Callable[[Any], bytes]] = None):
+        """Queue an append to the end of a file"""
+        self._put(path, data, True, encode)
+    
+    def _put(self, path: str, data: Any, append: bool, encode: Optional[Callable[[Any], bytes]]):
+        if self._thread is None:
+            self._start()
+        self._queue.put((path, data, append, encode))
+    
+    def flush(self):
+        """Block until every queued write has reached the file system"""
+        self._queue.join()
+    
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="student-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+    
+    @staticmethod
+    def _encode(item) -> Optional[bytes]:
+        path, data, _, encode = item
+        try:
+            return encode(data) if encode else data
+        except Exception as e:
+            print(f"Error serializing {path}: {e}")
+            return None
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                # Keep the thread alive; later writes must still go through
+                print(f"Error writing batch: {e}")
+            finally:
+                # Always release flush() waiters, even if a write blew up
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def _write_batch(self, batch):
+        # Later writes to the same path supersede earlier ones; appends
+        # extend whatever is already pending for that path
+        pending: Dict[str, Tuple[bytes, bool]] = {}
+        for item in batch:
+            path, _, append, _ = item
+            data = self._encode(item)
+            if data is None:
+                continue
+            if append and path in pending:
+                previous, previous_append = pending[path]
+                pending[path] = (previous + data, previous_append)
+            else:
+                pending[path] = (data, append)
+        for path, (data, append) in pending.items():
+            try:
+                self._write(path, data, append)
+            except Exception as e:
+                print(f"Error writing {path!r}: {e}")
+    
+    @staticmethod
+    def _write(path: str, data: bytes, append: bool = False):
+        view = memoryview(data)
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+        fd = os.open(path, flags, 0o644)
+        try:
+            if append and FCNTL_AVAILABLE:
+                # Appends go to shared logs; compact_index holds this lock
+                # while it folds and truncates the log
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def _replay_wal(f, records: Dict[str, Dict]) -> int:
+    """Apply every profile record in an open WAL file to ``records``
+    
+    Returns:
+        Number of records applied
+    """
+    replayed = 0
+    for line in f:
+        try:
+            data = decode_json(line)
+        except ValueError:
+            # Torn final line from an interrupted append
+            continue
+        records[data['student_id']] = data
+        replayed += 1
+    return replayed
+
+
+# Shared writer for profile, session and learning path files
+_writer = BatchFileWriter()
+
+# Fixed skill order for StudentProfile.skill_vec
+SKILL_NAMES = (
+    'keyword_identification',
+    'center_sentence',
+    'center_paragraph',
+    'topic_comprehension',
+    'vocabulary',
+    'inference',
+    'summary'
+)
+SKILL_INDEX = {name: i for i, name in enumerate(SKILL_NAMES)}
+
+# Initial level for every skill
+DEFAULT_SKILL_LEVEL = 50.0
+
+# Map question types to skills
+SKILL_MAPPING = {
+    'keywords': 'keyword_identification',
+    'center_sentence': 'center_sentence',
+    'center_paragraph': 'center_paragraph',
+    'topic': 'topic_comprehension'
+}
+
+# Learning rate for the skill level moving average
+SKILL_EMA_ALPHA = 0.2
+
+# Trend labels, indexed by threshold comparisons (see assess_skill)
+TRENDS = ("declining", "stable", "improving")
+
+# Practice strategy per skill for the low (<40) / medium (<70) / high levels
+SKILL_STRATEGIES: Dict[str, Tuple[str, str, str]] = {
+    'keyword_identification': (
+        "핵심 단어 찾기 연습: 문단을 읽고 가장 중요한 3-5개 단어를 선택하세요.",
+        "문맥에서 키워드 관계 파악: 선택한 키워드들이 서로 어떻게 연결되는지 설명하세요.",
+        "고급 키워드 분석: 추상적 개념을 나타내는 키워드를 식별하고 설명하세요."
+    ),
+    'center_sentence': (
+        "각 문단의 첫 문장과 마지막 문장을 비교하여 주제문을 찾는 연습을 하세요.",
+        "문단 구조 분석: 주제문과 뒷받침 문장을 구분하는 연습을 하세요.",
+        "암시적 주제문 파악: 직접 드러나지 않는 중심 생각을 추론하세요."
+    ),
+    'topic_comprehension': (
+        "글 전체를 한 문장으로 요약하는 연습을 매일 하세요.",
+        "단락별 요약 후 전체 주제로 통합하는 연습을 하세요.",
+        "글쓴이의 의도와 숨겨진 메시지를 파악하는 연습을 하세요."
+    )
+}
+
+# Extra advice for a changing skill trend
+TREND_ADVICE = {
+    "declining": "기초 개념을 다시 복습하고 쉬운 문제부터 시작하세요.",
+    "improving": "좋은 진전을 보이고 있습니다! 더 도전적인 문제를 시도해보세요."
+}
+
+# Profile storage: a pickled snapshot of all profiles plus an append-only
+# log of profile saves since the snapshot, folded in at compaction time
+PROFILE_INDEX = "profiles.pkl"
+PROFILE_WAL = "profiles.wal"
+WAL_COMPACT_THRESHOLD = 500
+
+# Sessions kept in memory per student (about six months of daily use);
+# older sessions remain in the sessions/ directory on disk, and exports
+# read them back from there
+SESSION_HISTORY = 180
+
+# Threads used to read individual profile files when no index exists
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _read_profile_file(path: str) -> Optional[Dict]:
+    """Read one profile JSON file, or None if it cannot be parsed"""
+    try:
+        with open(path, 'rb') as f:
+            return decode_json(f.read())
+    except Exception as e:
+        print(f"Error loading profile {os.path.basename(path)}: {e}")
+        return None
+
+
+def _flatten(data: Dict[str, Any], parent_key: str = ''):
+    """Yield (dotted_key, value) pairs for a nested dict, like pd.json_normalize"""
+    for key, value in data.items():
+        full_key = f"{parent_key}.{key}" if parent_key else key
+        if isinstance(value, dict):
+            yield from _flatten(value, full_key)
+        else:
+            yield full_key, value
 
 
 @dataclass
@@ -31,11 +297,48 @@ class StudentProfile:
     current_streak: int = 0
     longest_streak: int = 0
     achievements: List[str] = field(default_factory=list)
-    skill_levels: Dict[str, float] = field(default_factory=dict)
+    # Skill levels in SKILL_NAMES order
+    skill_vec: np.ndarray = field(default_factory=lambda: np.full(len(SKILL_NAMES), DEFAULT_SKILL_LEVEL),
+                                  compare=False)
     learning_goals: List[Dict] = field(default_factory=list)
     
+    SKILL_NAMES: ClassVar[Tuple[str, ...]] = SKILL_NAMES
+    
+    @property
+    def skill_levels(self) -> Dict[str, float]:
+        """Skill levels keyed by skill name.
+        
+        Returns a copy; mutating it does not touch the profile. Use
+        set_skill() or assign a whole mapping to this property instead.
+        """
+        return dict(zip(SKILL_NAMES, self.skill_vec.tolist()))
+    
+    @skill_levels.setter
+    def skill_levels(self, levels: Dict[str, float]):
+        self.skill_vec = self.skill_vec_from_dict(levels)
+    
+    def set_skill(self, name: str, level: float):
+        """Set a single skill level by name"""
+        if name not in SKILL_INDEX:
+            warnings.warn(f"Unknown skill {name!r} ignored", stacklevel=2)
+            return
+        self.skill_vec[SKILL_INDEX[name]] = level
+    
+    @staticmethod
+    def skill_vec_from_dict(skill_levels: Dict[str, float]) -> np.ndarray:
+        """Pack a name -> level mapping into a skill vector"""
+        vec = np.full(len(SKILL_NAMES), DEFAULT_SKILL_LEVEL)
+        for name, level in skill_levels.items():
+            if name in SKILL_INDEX:
+                vec[SKILL_INDEX[name]] = level
+            else:
+                warnings.warn(f"Unknown skill {name!r} ignored", stacklevel=2)
+        return vec
+    
     def to_dict(self):
         data = asdict(self)
+        del data['skill_vec']
+        data['skill_levels'] = self.skill_levels
         data['created_at'] = self.created_at.isoformat()
         data['last_active'] = self.last_active.isoformat()
         return data
@@ -54,13 +357,36 @@ class LearningSession:
     avg_response_time: float
     focus_score: float  # Based on consistency of responses
     notes: str = ""
+    duration_minutes_cached: Optional[float] = None  # set when the session ends
     
     def duration_minutes(self) -> float:
+        if self.duration_minutes_cached is not None:
+            return self.duration_minutes_cached
         if self.end_time:
             return (self.end_time - self.start_time).total_seconds() / 60
         return 0
 
 
+@dataclass
+class SessionAggregate:
+    """Running per-student session summary, maintained as sessions start"""
+    count: int = 0
+    activity_dates: List[date] = field(default_factory=list)  # sorted, unique
+    recent: Deque[LearningSession] = field(default_factory=lambda: deque(maxlen=10))  # newest first
+    
+    def add(self, session: LearningSession):
+        self.count += 1
+        day = session.start_time.date()
+        if not self.was_active(day):
+            bisect.insort(self.activity_dates, day)
+        self.recent.appendleft(session)
+    
+    def was_active(self, day: date) -> bool:
+        days = self.activity_dates
+        i = bisect.bisect_left(days, day)
+        return i < len(days) and days[i] == day
+
+
 @dataclass
 class SkillAssessment:
     """Assessment of specific reading skills"""
@@ -82,8 +408,12 @@ class StudentTracker:
         self.data_dir = data_dir
         self.ensure_directories()
         self.profiles: Dict[str, StudentProfile] = {}
-        self.sessions: Dict[str, List[LearningSession]] = defaultdict(list)
+        self.sessions: Dict[str, Deque[LearningSession]] = defaultdict(
+            lambda: deque(maxlen=SESSION_HISTORY))
+        self.aggregates: Dict[str, SessionAggregate] = defaultdict(SessionAggregate)
         self.skill_assessments: Dict[str, Dict[str, SkillAssessment]] = defaultdict(dict)
+        self.latest_learning_path: Dict[str, Dict] = {}
+        self._wal_entries = 0
         self.load_existing_data()
         
     def ensure_directories(self):
@@ -101,21 +431,115 @@ class StudentTracker:
     
     def load_existing_data(self):
         """Load existing student data from storage"""
-        # Load profiles
+        # Load profiles from the consolidated index; per-profile JSON files
+        # are only read once, to build the index for older data directories
+        if not self._load_index():
+            self._load_profile_files()
+            self.compact_index()
+        
+        self._load_latest_learning_paths()
+    
+    def _load_latest_learning_paths(self):
+        """Load the most recent saved learning path for each student"""
+        path_dir = os.path.join(self.data_dir, "learning_paths")
+        latest: Dict[str, str] = {}
+        with os.scandir(path_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.endswith('.json') and entry.is_file(follow_symlinks=False):
+                    # Files are named {student_id}_{YYYYMMDD}.json
+                    student_id = filename[:-len('.json')].rsplit('_', 1)[0]
+                    if filename > latest.get(student_id, ''):
+                        latest[student_id] = filename
+        
+        for student_id, filename in latest.items():
+            try:
+                with open(os.path.join(path_dir, filename), 'rb') as f:
+                    self.latest_learning_path[student_id] = decode_json(f.read())
+            except Exception as e:
+                print(f"Error loading learning path {filename}: {e}")
+    
+    def _load_index(self) -> bool:
+        """Load profiles from profiles.pkl and replay profiles.wal
+        
+        Returns:
+            False if no index exists yet
+        """
+        # Saves from another tracker in this process may still be queued
+        _writer.flush()
+        
+        index_path = os.path.join(self.data_dir, PROFILE_INDEX)
+        wal_path = os.path.join(self.data_dir, PROFILE_WAL)
+        if not os.path.exists(index_path):
+            return False
+        
+        with open(index_path, 'rb') as f:
+            records = pickle.load(f)
+        
+        replayed = 0
+        if os.path.exists(wal_path):
+            with open(wal_path, 'rb') as f:
+                replayed = _replay_wal(f, records)
+        
+        for student_id, data in records.items():
+            try:
+                self.profiles[student_id] = self._dict_to_profile(data)
+            except Exception as e:
+                print(f"Error loading profile {student_id}: {e}")
+        
+        if replayed:
+            self.compact_index()
+        return True
+    
+    def _load_profile_files(self):
+        """Load profiles from individual JSON files"""
         profile_dir = os.path.join(self.data_dir, "profiles")
-        for filename in os.listdir(profile_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(profile_dir, filename)
+        with os.scandir(profile_dir) as entries:
+            paths = [entry.path for entry in entries
+                     if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)]
+        
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            for data in executor.map(_read_profile_file, paths):
+                if data is None:
+                    continue
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        student_id = data['student_id']
-                        self.profiles[student_id] = self._dict_to_profile(data)
+                    self.profiles[data['student_id']] = self._dict_to_profile(data)
                 except Exception as e:
-                    print(f"Error loading profile {filename}: {e}")
+                    print(f"Error loading profile {data.get('student_id')}: {e}")
+    
+    def compact_index(self):
+        """Fold profiles.wal into profiles.pkl and truncate the WAL
+        
+        Other trackers (in this or another process) may share the data
+        directory, so the snapshot is rebuilt from the on-disk index plus the
+        whole WAL rather than from this tracker's profiles alone, under an
+        exclusive lock on the WAL that appends also take.
+        """
+        self.flush()
+        index_path = os.path.join(self.data_dir, PROFILE_INDEX)
+        tmp_path = index_path + '.tmp'
+        with open(os.path.join(self.data_dir, PROFILE_WAL), 'a+b') as wal:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(wal.fileno(), fcntl.LOCK_EX)
+            records: Dict[str, Dict] = {}
+            if os.path.exists(index_path):
+                with open(index_path, 'rb') as f:
+                    records = pickle.load(f)
+            # Profiles not yet on disk at all (e.g. just migrated from profiles/)
+            for sid, profile in self.profiles.items():
+                records.setdefault(sid, profile.to_dict())
+            wal.seek(0)
+            _replay_wal(wal, records)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, index_path)
+            wal.truncate(0)
+        self._wal_entries = 0
     
     def _dict_to_profile(self, data: Dict) -> StudentProfile:
         """Convert dictionary to StudentProfile"""
+        data = dict(data)
+        data['skill_vec'] = StudentProfile.skill_vec_from_dict(data.pop('skill_levels', {}))
         data['created_at'] = datetime.fromisoformat(data['created_at'])
         data['last_active'] = datetime.fromisoformat(data['last_active'])
         return StudentProfile(**data)
@@ -126,22 +550,14 @@ class StudentTracker:
                               email: str,
                               class_id: str) -> StudentProfile:
         """Create a new student profile"""
+        now = datetime.now()
         profile = StudentProfile(
             student_id=student_id,
             name=name,
             email=email,
             class_id=class_id,
-            created_at=datetime.now(),
-            last_active=datetime.now(),
-            skill_levels={
-                'keyword_identification': 50.0,
-                'center_sentence': 50.0,
-                'center_paragraph': 50.0,
-                'topic_comprehension': 50.0,
-                'vocabulary': 50.0,
-                'inference': 50.0,
-                'summary': 50.0
-            }
+            created_at=now,
+            last_active=now
         )
         
         self.profiles[student_id] = profile
@@ -149,17 +565,23 @@ class StudentTracker:
         return profile
     
     def save_profile(self, profile: StudentProfile):
-        """Save student profile to disk"""
-        filepath = os.path.join(self.data_dir, "profiles", f"{profile.student_id}.json")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(profile.to_dict(), f, ensure_ascii=False, indent=2)
+        """Save student profile to disk (appended to the profile WAL)"""
+        _writer.append(os.path.join(self.data_dir, PROFILE_WAL), profile.to_dict(), encode_json_line)
+        self._wal_entries += 1
+        if self._wal_entries >= WAL_COMPACT_THRESHOLD:
+            self.compact_index()
+    
+    def flush(self):
+        """Wait until all pending profile/session/learning path writes are on disk"""
+        _writer.flush()
     
     def start_learning_session(self, student_id: str) -> LearningSession:
         """Start a new learning session"""
+        now = datetime.now()
         session = LearningSession(
-            session_id=f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{student_id}",
+            session_id=f"session_{now.strftime('%Y%m%d_%H%M%S')}_{student_id}",
             student_id=student_id,
-            start_time=datetime.now(),
+            start_time=now,
             end_time=None,
             tasks_attempted=[],
             tasks_completed=[],
@@ -169,18 +591,20 @@ class StudentTracker:
         )
         
         self.sessions[student_id].append(session)
+        self.aggregates[student_id].add(session)
         
         # Update profile
         if student_id in self.profiles:
-            self.profiles[student_id].last_active = datetime.now()
+            self.profiles[student_id].last_active = now
             self.profiles[student_id].total_sessions += 1
-            self.update_streak(student_id)
+            self.update_streak(student_id, now.date())
         
         return session
     
     def end_learning_session(self, session: LearningSession, performance_data: Dict):
         """End a learning session and update metrics"""
         session.end_time = datetime.now()
+        session.duration_minutes_cached = (session.end_time - session.start_time).total_seconds() / 60
         session.accuracy = performance_data.get('accuracy', 0.0)
         session.avg_response_time = performance_data.get('avg_response_time', 0.0)
         session.tasks_completed = performance_data.get('completed_tasks', [])
@@ -188,10 +612,8 @@ class StudentTracker:
         # Calculate focus score based on response time consistency
         response_times = performance_data.get('response_times', [])
         if response_times:
-            std_dev = np.std(response_times)
-            mean_time = np.mean(response_times)
             # Lower variation = higher focus
-            session.focus_score = max(0, min(1, 1 - (std_dev / mean_time) if mean_time > 0 else 0))
+            session.focus_score = focus_score(np.asarray(response_times, dtype=np.float64))
         
         # Update student profile
         student_id = session.student_id
@@ -222,36 +644,30 @@ class StudentTracker:
             'focus_score': session.focus_score,
             'notes': session.notes
         }
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _writer.submit(filepath, data, encode_json)
     
-    def update_streak(self, student_id: str):
+    def update_streak(self, student_id: str, today: Optional[date] = None):
         """Update learning streak for a student"""
         if student_id not in self.profiles:
             return
         
         profile = self.profiles[student_id]
-        sessions = self.sessions.get(student_id, [])
+        aggregate = self.aggregates.get(student_id)
         
-        if not sessions:
+        if not aggregate or not aggregate.count:
             return
         
         # Check if there was activity yesterday
-        yesterday = datetime.now().date() - timedelta(days=1)
-        had_yesterday_activity = any(
-            s.start_time.date() == yesterday for s in sessions
-        )
+        if today is None:
+            today = datetime.now().date()
+        yesterday = today - timedelta(days=1)
         
-        if had_yesterday_activity:
+        if aggregate.was_active(yesterday):
             profile.current_streak += 1
             profile.longest_streak = max(profile.longest_streak, profile.current_streak)
         else:
             # Check if there's activity today (not breaking streak)
-            today = datetime.now().date()
-            had_today_activity = any(
-                s.start_time.date() == today for s in sessions
-            )
-            if not had_today_activity:
+            if not aggregate.was_active(today):
                 profile.current_streak = 1
     
     def update_skill_levels(self, student_id: str, performance_data: Dict):
@@ -261,23 +677,19 @@ class StudentTracker:
         
         profile = self.profiles[student_id]
         
-        # Map question types to skills
-        skill_mapping = {
-            'keywords': 'keyword_identification',
-            'center_sentence': 'center_sentence',
-            'center_paragraph': 'center_paragraph',
-            'topic': 'topic_comprehension'
-        }
+        present = [q_type for q_type in SKILL_MAPPING if q_type in performance_data]
+        if not present:
+            return
         
-        for q_type, skill in skill_mapping.items():
-            if q_type in performance_data:
-                accuracy = performance_data[q_type].get('accuracy', 0)
-                current_level = profile.skill_levels.get(skill, 50)
-                
-                # Exponential moving average for skill update
-                alpha = 0.2  # Learning rate
-                new_level = (1 - alpha) * current_level + alpha * (accuracy * 100)
-                profile.skill_levels[skill] = min(100, max(0, new_level))
+        idx = np.fromiter((SKILL_INDEX[SKILL_MAPPING[q_type]] for q_type in present),
+                          dtype=np.intp, count=len(present))
+        accuracy = np.fromiter(
+            (performance_data[q_type].get('accuracy', 0) for q_type in present),
+            dtype=np.float64, count=len(present)
+        )
+        
+        # Exponential moving average for skill update, all skills at once
+        profile.skill_vec[idx] = batch_ema(profile.skill_vec[idx], accuracy, SKILL_EMA_ALPHA)
     
     def assess_skill(self, student_id: str, skill_name: str, 
                     performance: float) -> SkillAssessment:
@@ -286,6 +698,7 @@ class StudentTracker:
             self.skill_assessments[student_id] = {}
         
         assessments = self.skill_assessments[student_id]
+        now = datetime.now()
         
         if skill_name in assessments:
             assessment = assessments[skill_name]
@@ -295,22 +708,19 @@ class StudentTracker:
             weight = 0.3  # Weight for new performance
             assessment.current_level = (1 - weight) * old_level + weight * performance
             
-            # Determine trend
-            if assessment.current_level > old_level + 5:
-                assessment.trend = "improving"
-            elif assessment.current_level < old_level - 5:
-                assessment.trend = "declining"
-            else:
-                assessment.trend = "stable"
+            # Determine trend: index 0/1/2 for a change below -5, within
+            # +/-5, or above +5
+            delta = assessment.current_level - old_level
+            assessment.trend = TRENDS[(delta > 5) - (delta < -5) + 1]
             
-            assessment.last_assessed = datetime.now()
+            assessment.last_assessed = now
             assessment.assessment_count += 1
         else:
             assessment = SkillAssessment(
                 skill_name=skill_name,
                 current_level=performance,
                 trend="stable",
-                last_assessed=datetime.now(),
+                last_assessed=now,
                 assessment_count=1,
                 recommendations=[]
             )
@@ -325,41 +735,15 @@ class StudentTracker:
         """Generate recommendations for skill improvement"""
         recommendations = []
         
-        skill_strategies = {
-            'keyword_identification': {
-                'low': "핵심 단어 찾기 연습: 문단을 읽고 가장 중요한 3-5개 단어를 선택하세요.",
-                'medium': "문맥에서 키워드 관계 파악: 선택한 키워드들이 서로 어떻게 연결되는지 설명하세요.",
-                'high': "고급 키워드 분석: 추상적 개념을 나타내는 키워드를 식별하고 설명하세요."
-            },
-            'center_sentence': {
-                'low': "각 문단의 첫 문장과 마지막 문장을 비교하여 주제문을 찾는 연습을 하세요.",
-                'medium': "문단 구조 분석: 주제문과 뒷받침 문장을 구분하는 연습을 하세요.",
-                'high': "암시적 주제문 파악: 직접 드러나지 않는 중심 생각을 추론하세요."
-            },
-            'topic_comprehension': {
-                'low': "글 전체를 한 문장으로 요약하는 연습을 매일 하세요.",
-                'medium': "단락별 요약 후 전체 주제로 통합하는 연습을 하세요.",
-                'high': "글쓴이의 의도와 숨겨진 메시지를 파악하는 연습을 하세요."
-            }
-        }
-        
-        if assessment.skill_name in skill_strategies:
-            strategies = skill_strategies[assessment.skill_name]
-            
-            if assessment.current_level < 40:
-                level = 'low'
-            elif assessment.current_level < 70:
-                level = 'medium'
-            else:
-                level = 'high'
-            
+        strategies = SKILL_STRATEGIES.get(assessment.skill_name)
+        if strategies:
+            level = (assessment.current_level >= 40) + (assessment.current_level >= 70)
             recommendations.append(strategies[level])
             
             # Add trend-based recommendations
-            if assessment.trend == "declining":
-                recommendations.append("기초 개념을 다시 복습하고 쉬운 문제부터 시작하세요.")
-            elif assessment.trend == "improving":
-                recommendations.append("좋은 진전을 보이고 있습니다! 더 도전적인 문제를 시도해보세요.")
+            advice = TREND_ADVICE.get(assessment.trend)
+            if advice:
+                recommendations.append(advice)
         
         return recommendations
     
@@ -370,12 +754,13 @@ class StudentTracker:
             return {}
         
         profile = self.profiles[student_id]
+        overall_level = self._calculate_overall_level(profile)
         learning_path = {
             'student_id': student_id,
             'created_at': datetime.now().isoformat(),
             'goal_period_days': goal_period_days,
-            'current_level': self._calculate_overall_level(profile),
-            'target_level': min(100, self._calculate_overall_level(profile) + 15),
+            'current_level': overall_level,
+            'target_level': min(100, overall_level + 15),
             'weekly_goals': [],
             'recommended_topics': [],
             'practice_schedule': [],
@@ -383,10 +768,7 @@ class StudentTracker:
         }
         
         # Identify weak areas
-        weak_skills = [
-            skill for skill, level in profile.skill_levels.items()
-            if level < 60
-        ]
+        weak_skills = [SKILL_NAMES[i] for i in np.flatnonzero(profile.skill_vec < 60)]
         
         # Generate weekly goals
         weeks = goal_period_days // 7
@@ -396,7 +778,7 @@ class StudentTracker:
                 'focus_skill': weak_skills[min(week - 1, len(weak_skills) - 1)] if weak_skills else 'general',
                 'target_exercises': 15,
                 'target_accuracy': 0.7 + (week * 0.05),
-                'recommended_difficulty': self._recommend_difficulty(profile, week)
+                'recommended_difficulty': self._recommend_difficulty(overall_level, week)
             }
             learning_path['weekly_goals'].append(weekly_goal)
         
@@ -407,7 +789,7 @@ class StudentTracker:
         learning_path['practice_schedule'] = self._create_practice_schedule(profile, goal_period_days)
         
         # Set milestones
-        learning_path['milestones'] = self._set_milestones(profile, goal_period_days)
+        learning_path['milestones'] = self._set_milestones(overall_level, goal_period_days)
         
         # Save learning path
         self.save_learning_path(student_id, learning_path)
@@ -416,14 +798,10 @@ class StudentTracker:
     
     def _calculate_overall_level(self, profile: StudentProfile) -> float:
         """Calculate overall skill level"""
-        if not profile.skill_levels:
-            return 50.0
-        return np.mean(list(profile.skill_levels.values()))
+        return float(profile.skill_vec.mean())
     
-    def _recommend_difficulty(self, profile: StudentProfile, week: int) -> str:
+    def _recommend_difficulty(self, overall_level: float, week: int) -> str:
         """Recommend difficulty level based on current performance"""
-        overall_level = self._calculate_overall_level(profile)
-        
         if overall_level < 40:
             return "easy"
         elif overall_level < 60:
@@ -445,7 +823,7 @@ class StudentTracker:
         ]
         
         # Prioritize based on past performance (placeholder logic)
-        weak_skill = min(profile.skill_levels.items(), key=lambda x: x[1])[0]
+        weak_skill = SKILL_NAMES[int(np.argmin(profile.skill_vec))]
         
         if 'keyword' in weak_skill:
             topics.insert(0, "어휘가 풍부한 설명문")
@@ -488,17 +866,16 @@ class StudentTracker:
     
     def _get_focus_area_for_day(self, profile: StudentProfile, day: int) -> str:
         """Determine focus area for a specific day"""
-        weak_skills = sorted(profile.skill_levels.items(), key=lambda x: x[1])
+        weak_order = np.argsort(profile.skill_vec, kind='stable')
         
         # Rotate through weak skills
-        skill_index = (day - 1) % min(3, len(weak_skills))
-        return weak_skills[skill_index][0]
+        skill_index = (day - 1) % min(3, len(weak_order))
+        return SKILL_NAMES[weak_order[skill_index]]
     
-    def _set_milestones(self, profile: StudentProfile, 
+    def _set_milestones(self, current_level: float, 
                        goal_period_days: int) -> List[Dict]:
         """Set learning milestones"""
         milestones = []
-        current_level = self._calculate_overall_level(profile)
         
         milestone_dates = [7, 14, 21, goal_period_days]
         milestone_targets = [
@@ -535,8 +912,8 @@ class StudentTracker:
             "learning_paths", 
             f"{student_id}_{datetime.now().strftime('%Y%m%d')}.json"
         )
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(learning_path, f, ensure_ascii=False, indent=2)
+        _writer.submit(filepath, learning_path, encode_json)
+        self.latest_learning_path[student_id] = learning_path
     
     def track_progress(self, student_id: str) -> Dict[str, Any]:
         """Track student progress against learning path"""
@@ -544,13 +921,13 @@ class StudentTracker:
             return {}
         
         profile = self.profiles[student_id]
-        sessions = self.sessions.get(student_id, [])
+        aggregate = self.aggregates.get(student_id, SessionAggregate())
         
         # Calculate progress metrics
         progress = {
             'student_id': student_id,
             'overall_progress': self._calculate_overall_level(profile),
-            'sessions_completed': len(sessions),
+            'sessions_completed': aggregate.count,
             'total_time_spent': profile.total_time_spent,
             'current_streak': profile.current_streak,
             'skill_improvements': {},
@@ -569,20 +946,13 @@ class StudentTracker:
                 'status': 'improving' if improvement > 0 else 'needs_work'
             }
         
-        # Find next milestone
-        learning_path_files = glob.glob(
-            os.path.join(self.data_dir, "learning_paths", f"{student_id}_*.json")
-        )
-        if learning_path_files:
-            # Get most recent learning path
-            latest_path_file = max(learning_path_files)
-            with open(latest_path_file, 'r', encoding='utf-8') as f:
-                learning_path = json.load(f)
-                
-                for milestone in learning_path.get('milestones', []):
-                    if milestone['target_level'] > progress['overall_progress']:
-                        progress['next_milestone'] = milestone
-                        break
+        # Find next milestone in the most recent learning path
+        learning_path = self.latest_learning_path.get(student_id)
+        if learning_path:
+            for milestone in learning_path.get('milestones', []):
+                if milestone['target_level'] > progress['overall_progress']:
+                    progress['next_milestone'] = milestone
+                    break
         
         # Generate progress-based recommendations
         if progress['overall_progress'] < 40:
@@ -605,7 +975,7 @@ class StudentTracker:
             return {}
         
         profile = self.profiles[student_id]
-        sessions = self.sessions.get(student_id, [])
+        aggregate = self.aggregates.get(student_id, SessionAggregate())
         assessments = self.skill_assessments.get(student_id, {})
         
         report = {
@@ -641,7 +1011,7 @@ class StudentTracker:
             }
         
         # Recent sessions (last 10)
-        recent = sorted(sessions, key=lambda x: x.start_time, reverse=True)[:10]
+        recent = list(aggregate.recent)
         for session in recent:
             report['recent_sessions'].append({
                 'date': session.start_time.isoformat(),
@@ -651,19 +1021,19 @@ class StudentTracker:
             })
         
         # Predict future performance
-        if len(sessions) >= 5:
+        if aggregate.count >= 5:
             recent_accuracies = [s.accuracy for s in recent[:5]]
-            trend = np.polyfit(range(len(recent_accuracies)), recent_accuracies, 1)[0]
+            trend = float(batch_slope(np.array([recent_accuracies], dtype=np.float64))[0])
             
             report['predicted_performance'] = {
                 'next_session_accuracy': min(1.0, max(0, recent_accuracies[0] + trend)),
                 'week_projection': min(1.0, max(0, recent_accuracies[0] + trend * 7)),
-                'confidence': 'high' if len(sessions) >= 10 else 'medium'
+                'confidence': 'high' if aggregate.count >= 10 else 'medium'
             }
         
         # Generate personalized recommendations
-        weak_skill = min(profile.skill_levels.items(), key=lambda x: x[1])
-        report['recommendations'].append(f"{weak_skill[0]} 실력 향상에 집중하세요.")
+        weak_skill = SKILL_NAMES[int(np.argmin(profile.skill_vec))]
+        report['recommendations'].append(f"{weak_skill} 실력 향상에 집중하세요.")
         
         if profile.current_streak == 0:
             report['recommendations'].append("규칙적인 학습 습관을 만들어보세요.")
@@ -673,6 +1043,52 @@ class StudentTracker:
         
         return report
     
+    def _export_sessions(self, student_id: str) -> List[Dict]:
+        """Every session of a student, oldest first.
+        
+        self.sessions only holds the last SESSION_HISTORY sessions, so the
+        full history is read back from the sessions/ directory and merged
+        with the in-memory sessions (which include any still in progress).
+        """
+        _writer.flush()
+        rows: Dict[str, Dict] = {}
+        sessions_dir = os.path.join(self.data_dir, "sessions")
+        suffix = f"_{student_id}.json"
+        with os.scandir(sessions_dir) as entries:
+            paths = [entry.path for entry in entries
+                     if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)]
+        
+        for path in paths:
+            try:
+                with open(path, 'rb') as f:
+                    data = decode_json(f.read())
+                if data.get('student_id') != student_id:
+                    continue
+                duration = 0
+                if data.get('end_time'):
+                    duration = (datetime.fromisoformat(data['end_time']) -
+                                datetime.fromisoformat(data['start_time'])).total_seconds() / 60
+                rows[data['session_id']] = {
+                    'session_id': data['session_id'],
+                    'start_time': data['start_time'],
+                    'end_time': data.get('end_time'),
+                    'duration_minutes': duration,
+                    'accuracy': data.get('accuracy', 0.0),
+                    'focus_score': data.get('focus_score', 1.0)
+                }
+            except Exception as e:
+                print(f"Error loading session {os.path.basename(path)}: {e}")
+        for s in self.sessions.get(student_id, []):
+            rows[s.session_id] = {
+                'session_id': s.session_id,
+                'start_time': s.start_time.isoformat(),
+                'end_time': s.end_time.isoformat() if s.end_time else None,
+                'duration_minutes': s.duration_minutes(),
+                'accuracy': s.accuracy,
+                'focus_score': s.focus_score
+            }
+        return sorted(rows.values(), key=lambda row: row['start_time'])
+    
     def export_student_data(self, student_id: str, format: str = 'json') -> str:
         """Export all student data"""
         if student_id not in self.profiles:
@@ -684,31 +1100,24 @@ class StudentTracker:
         # Gather all data
         export_data = {
             'profile': self.profiles[student_id].to_dict(),
-            'sessions': [
-                {
-                    'session_id': s.session_id,
-                    'start_time': s.start_time.isoformat(),
-                    'end_time': s.end_time.isoformat() if s.end_time else None,
-                    'duration_minutes': s.duration_minutes(),
-                    'accuracy': s.accuracy,
-                    'focus_score': s.focus_score
-                }
-                for s in self.sessions.get(student_id, [])
-            ],
+            'sessions': self._export_sessions(student_id),
             'progress': self.track_progress(student_id),
             'detailed_report': self.get_detailed_report(student_id)
         }
         
         if format == 'json':
             filepath = os.path.join(self.data_dir, 'progress_reports', f"{filename}.json")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(encode_json(export_data))
         
         elif format == 'csv':
             filepath = os.path.join(self.data_dir, 'progress_reports', f"{filename}.csv")
-            # Flatten data for CSV
-            df = pd.json_normalize(export_data['profile'])
-            df.to_csv(filepath, index=False)
+            # Flatten data for CSV: one header row of dotted keys, one value row
+            keys, values = zip(*_flatten(export_data['profile']))
+            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(keys)
+                writer.writerow(values)
         
         return filepath
 
@@ -5,113 +5,325 @@
 """
 
 import json
+import mmap
 import os
+import pickle
 import random
-import glob
-from typing import Dict, List, Optional
+import functools
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import re
+import sys
+from array import array
+import textwrap
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from konlpy.tag import Mecab
+    MECAB_AVAILABLE = True
+except ImportError:
+    MECAB_AVAILABLE = False
+
+# 한글 음절 연속 구간 (유사도 계산용 토큰)
+_HANGUL_RE = re.compile(r'[가-힣]+')
+
+if NUMBA_AVAILABLE:
+    # 첫 호출 때 컴파일하고 (cache=True로 이후 실행은 디스크 캐시에서 로드)
+    @njit(cache=True)
+    def _hangul_spans(codes):
+        """코드포인트 배열에서 한글 음절(U+AC00..U+D7A3) 연속 구간의 (시작, 끝) 목록"""
+        n = codes.shape[0]
+        spans = np.empty(((n + 1) // 2, 2), dtype=np.int64)
+        count = 0
+        start = -1
+        for i in range(n):
+            if 0xAC00 <= codes[i] <= 0xD7A3:
+                if start < 0:
+                    start = i
+            elif start >= 0:
+                spans[count, 0] = start
+                spans[count, 1] = i
+                count += 1
+                start = -1
+        if start >= 0:
+            spans[count, 0] = start
+            spans[count, 1] = n
+            count += 1
+        return spans[:count]
+    
+    def _hangul_tokens(text: str) -> List[str]:
+        """한글 토큰 목록 (_HANGUL_RE.findall과 동일)"""
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        return [text[start:end] for start, end in _hangul_spans(codes).tolist()]
+else:
+    _hangul_tokens = _HANGUL_RE.findall
+
+# 유사도 계산에 쓰는 내용 형태소 품사 (일반/고유 명사, 동사, 형용사)
+CONTENT_POS = frozenset({'NNG', 'NNP', 'VV', 'VA'})
+
+# 바이트 값별 1의 개수 (uint64 비트셋 행렬의 popcount용)
+if NUMPY_AVAILABLE:
+    _POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# 과제 본문 출력용 줄바꿈 (70자)
+_WRAPPER = textwrap.TextWrapper(width=70, break_long_words=False, break_on_hyphens=False)
+
+# 시작 시 과제 파일을 읽는 스레드 수
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# 다시 파싱할 파일이 이보다 많으면 스레드 대신 프로세스로 파싱 (CPU 바운드)
+PROCESS_LOAD_THRESHOLD = 500
+
+# 과제 캐시 형식 버전 (캐시 항목 구조가 바뀌면 올린다)
+TASK_CACHE_VERSION = 2
+
+# 과제 캐시를 두는 디렉터리 (.gitignore의 .cache/)
+TASK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def _emit(lines: List[str]):
+    """여러 줄을 한 번의 write로 출력 (다음 input()이 버퍼를 비운다)"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _parse_choice(raw: str) -> int:
+    """객관식 답 번호 파싱 (숫자가 아니면 ValueError)"""
+    raw = raw.strip()
+    # 흔한 경우인 한 자리 숫자는 int() 파서를 거치지 않는다
+    if len(raw) == 1 and '0' <= raw <= '9':
+        return ord(raw) - 48
+    return int(raw)
+
+
+def _read_task_file(file_path: str) -> Dict:
+    """과제 JSON 파일 파싱"""
+    with open(file_path, 'rb') as f:
+        if ORJSON_AVAILABLE:
+            # orjson은 버퍼를 직접 파싱하므로 파일 내용을 복사하지 않는다
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                return _loads(view)
+        return _loads(f.read())
+
+
+def _load_task_summary(file_path: str) -> Optional[Dict]:
+    """과제 파일 하나를 읽어 요약 반환 (실패 시 None)
+    
+    프로세스 풀에서도 쓰이므로 모듈 수준 함수로 둔다.
+    """
+    try:
+        task = _read_task_file(file_path)
+        return {
+            'id': task.get('id'),
+            'task_type': task.get('task_type'),
+            'difficulty': task.get('metainfo', {}).get('difficulty'),
+            'target_topic': task.get('q_topic_free', {}).get('target_topic'),
+            'file_path': file_path
+        }
+    except Exception as e:
+        print(f"파일 로드 실패 {file_path}: {e}")
+        return None
+
 
 class StudySystem:
     """읽기 이해 학습 시스템"""
     
     def __init__(self, task_dir: str = "generator/out"):
         self.task_dir = task_dir
+        # 과제 목록 (id, task_type, difficulty, target_topic, file_path만 담은 요약)
         self.tasks = self.load_tasks()
+        # 선택된 과제 본문은 필요할 때 파일에서 읽고 최근 것만 보관
+        self._materialize = functools.lru_cache(maxsize=32)(self._read_task)
+        
+        # 유형/난이도별 과제 인덱스
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        self._by_difficulty: Dict[str, List[int]] = defaultdict(list)
+        for idx, task in enumerate(self.tasks):
+            self._by_type[task['task_type']].append(idx)
+            self._by_difficulty[task['difficulty']].append(idx)
+        
         self.current_task = None
-        self.score_history = []
+        # 학습 기록 (열 단위 저장: 결과 하나가 각 열의 같은 위치에 대응)
+        self.task_ids: List[str] = []
+        self.task_types: List[str] = []
+        self.difficulties: List[str] = []
+        self.scores = array('i')
+        self.totals = array('i')
+        self.timestamps: List[str] = []
+        # 학습 통계 누적값: 점수 합, 난이도/유형별 [점수 합, 과제 수]
+        self._score_sum = 0
+        self._difficulty_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._type_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
         self.session_start = datetime.now()
         
+        # 모범답안 토큰을 정수 id로 인터닝하고, 각 모범답안을 (비트셋, 토큰 수)로 저장
+        # MeCab-ko 사전이 있으면 내용 형태소, 없으면 한글 어절 단위로 토큰화
+        self._mecab = None
+        if MECAB_AVAILABLE:
+            try:
+                self._mecab = Mecab()
+            except Exception as e:
+                print(f"MeCab 초기화 실패, 어절 단위 유사도 사용: {e}")
+        
+        self._vocab: Dict[str, int] = {}
+        self._target_bits: Dict[str, Tuple[int, int]] = {}
+        for task in self.tasks:
+            if task['target_topic'] is not None:
+                self._intern_target(task['target_topic'])
+        self._build_target_matrix()
+        
     def load_tasks(self) -> List[Dict]:
-        """모든 과제 파일 로드"""
-        tasks = []
-        json_files = glob.glob(os.path.join(self.task_dir, "*.json"))
+        """모든 과제 파일의 요약 로드
+        
+        파일의 (mtime, 크기)가 이전 실행과 같으면 캐시에 저장된 요약을
+        재사용하고, 새로 생기거나 바뀐 파일만 다시 파싱한다. 캐시는
+        TASK_CACHE_DIR 아래에 과제 디렉터리 경로별로 하나씩 둔다.
+        """
+        dir_key = hashlib.sha1(os.path.abspath(self.task_dir).encode()).hexdigest()[:16]
+        cache_path = os.path.join(TASK_CACHE_DIR, f"tasks_{dir_key}.pkl")
+        try:
+            stats = {}
+            with os.scandir(self.task_dir) as entries:
+                for e in entries:
+                    if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file():
+                        st = e.stat()
+                        stats[e.path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return []
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                version, cached = pickle.load(f)
+            if version != TASK_CACHE_VERSION:
+                cached = {}
+        except Exception:
+            cached = {}
+        
+        # path -> (mtime_ns, size, 과제 요약)
+        entries = {}
+        stale = []
+        for path, key in stats.items():
+            entry = cached.get(path)
+            if entry is not None and entry[:2] == key:
+                entries[path] = entry
+            else:
+                stale.append(path)
+        
+        if stale:
+            if len(stale) > PROCESS_LOAD_THRESHOLD:
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+                chunksize = 32
+            else:
+                executor = ThreadPoolExecutor(max_workers=LOAD_WORKERS)
+                chunksize = 1
+            with executor:
+                summaries = executor.map(_load_task_summary, stale, chunksize=chunksize)
+                for path, task in zip(stale, summaries):
+                    if task is not None:
+                        entries[path] = stats[path] + (task,)
         
-        for file_path in json_files:
+        if stale or entries.keys() != cached.keys():
+            tmp_path = cache_path + ".tmp"
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    task = json.load(f)
-                    task['file_path'] = file_path
-                    tasks.append(task)
-            except Exception as e:
-                print(f"파일 로드 실패 {file_path}: {e}")
+                os.makedirs(TASK_CACHE_DIR, exist_ok=True)
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump((TASK_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"과제 캐시 저장 실패 {cache_path}: {e}")
         
-        return tasks
+        return [entries[path][2] for path in stats if path in entries]
+    
+    def _read_task(self, idx: int) -> Dict:
+        """self.tasks[idx] 과제 본문 전체 로드"""
+        file_path = self.tasks[idx]['file_path']
+        task = _read_task_file(file_path)
+        task['file_path'] = file_path
+        return task
+    
+    def get_random_task(self) -> Optional[Dict]:
+        """전체 과제 중 랜덤 선택"""
+        return self._materialize(random.randrange(len(self.tasks))) if self.tasks else None
     
     def get_task_by_type(self, task_type: str) -> Optional[Dict]:
         """특정 타입의 과제 랜덤 선택"""
-        filtered = [t for t in self.tasks if t.get('task_type') == task_type]
-        return random.choice(filtered) if filtered else None
+        indices = self._by_type.get(task_type)
+        return self._materialize(random.choice(indices)) if indices else None
     
     def get_task_by_difficulty(self, difficulty: str) -> Optional[Dict]:
         """특정 난이도의 과제 랜덤 선택"""
-        filtered = [t for t in self.tasks if t.get('metainfo', {}).get('difficulty') == difficulty]
-        return random.choice(filtered) if filtered else None
+        indices = self._by_difficulty.get(difficulty)
+        return self._materialize(random.choice(indices)) if indices else None
     
     def display_task(self, task: Dict):
         """과제 내용 표시"""
-        print("\n" + "=" * 80)
+        lines = ["\n" + "=" * 80]
         
         if task['task_type'] == 'paragraph':
-            print("📝 문단 읽기 과제")
-            print("-" * 80)
-            print(f"주제 힌트: {task['paragraph']['topic_hint']}")
-            print("-" * 80)
-            
-            # 문단 표시 (줄바꿈 추가)
-            text = task['paragraph']['text']
-            words = text.split()
-            line = ""
-            for word in words:
-                if len(line + word) > 70:
-                    print(line)
-                    line = word + " "
-                else:
-                    line += word + " "
-            if line:
-                print(line)
+            lines += [
+                "📝 문단 읽기 과제",
+                "-" * 80,
+                f"주제 힌트: {task['paragraph']['topic_hint']}",
+                "-" * 80,
+                # 문단 표시 (줄바꿈 추가)
+                _WRAPPER.fill(task['paragraph']['text'])
+            ]
                 
         else:  # article
-            print("📚 글 읽기 과제")
-            print("-" * 80)
-            print(f"제목: {task['article']['title']}")
-            print("-" * 80)
+            lines += [
+                "📚 글 읽기 과제",
+                "-" * 80,
+                f"제목: {task['article']['title']}",
+                "-" * 80
+            ]
             
             for idx, para in enumerate(task['article']['paragraphs'], 1):
-                print(f"\n[문단 {idx}]")
+                lines.append(f"\n[문단 {idx}]")
                 # 문단별 줄바꿈
-                words = para.split()
-                line = ""
-                for word in words:
-                    if len(line + word) > 70:
-                        print(line)
-                        line = word + " "
-                    else:
-                        line += word + " "
-                if line:
-                    print(line)
+                lines.append(_WRAPPER.fill(para))
         
-        print("\n" + "=" * 80)
+        lines.append("\n" + "=" * 80)
+        _emit(lines)
     
     def ask_keyword_question(self, task: Dict) -> bool:
         """핵심어 선택 문제"""
         q = task['q_keywords_mcq']
-        print("\n[문제 1] " + q['stem'])
-        print("-" * 40)
-        
-        for idx, choice in enumerate(q['choices'], 1):
-            print(f"{idx}. {choice}")
+        lines = ["\n[문제 1] " + q['stem'], "-" * 40]
+        lines += [f"{idx}. {choice}" for idx, choice in enumerate(q['choices'], 1)]
+        _emit(lines)
         
         while True:
             try:
-                answer = int(input("\n답을 선택하세요 (1-4): "))
+                answer = _parse_choice(input("\n답을 선택하세요 (1-4): "))
                 if 1 <= answer <= 4:
                     correct = (answer - 1) == q['answer_index']
                     if correct:
                         print("✅ 정답입니다!")
                     else:
-                        print(f"❌ 틀렸습니다. 정답은 {q['answer_index']+1}번입니다.")
-                        print(f"설명: {q['rationale']}")
+                        _emit([f"❌ 틀렸습니다. 정답은 {q['answer_index']+1}번입니다.",
+                               f"설명: {q['rationale']}"])
                     return correct
             except ValueError:
                 print("숫자를 입력해주세요.")
@@ -120,27 +332,25 @@ class StudySystem:
         """중심문장 선택 문제"""
         if task['task_type'] == 'paragraph':
             q = task['q_center_sentence_mcq']
-            print("\n[문제 2] " + q['stem'])
         else:
             q = task['q_center_paragraph_mcq']
-            print("\n[문제 2] " + q['stem'])
-        
-        print("-" * 40)
         
-        for sentence in q.get('sentences', q.get('choices', [])):
-            print(f"{sentence['idx']}. {sentence['text']}")
+        lines = ["\n[문제 2] " + q['stem'], "-" * 40]
+        lines += [f"{sentence['idx']}. {sentence['text']}"
+                  for sentence in q.get('sentences', q.get('choices', []))]
+        _emit(lines)
         
         while True:
             try:
                 max_choice = len(q.get('sentences', q.get('choices', [])))
-                answer = int(input(f"\n답을 선택하세요 (1-{max_choice}): "))
+                answer = _parse_choice(input(f"\n답을 선택하세요 (1-{max_choice}): "))
                 if 1 <= answer <= max_choice:
                     correct = answer == q['answer_idx']
                     if correct:
                         print("✅ 정답입니다!")
                     else:
-                        print(f"❌ 틀렸습니다. 정답은 {q['answer_idx']}번입니다.")
-                        print(f"설명: {q['rationale']}")
+                        _emit([f"❌ 틀렸습니다. 정답은 {q['answer_idx']}번입니다.",
+                               f"설명: {q['rationale']}"])
                     return correct
             except ValueError:
                 print("숫자를 입력해주세요.")
@@ -148,8 +358,7 @@ class StudySystem:
     def ask_topic_question(self, task: Dict) -> float:
         """주제 서술형 문제"""
         q = task['q_topic_free']
-        print("\n[문제 3] " + q['stem'])
-        print("-" * 40)
+        _emit(["\n[문제 3] " + q['stem'], "-" * 40])
         
         user_answer = input("\n답: ").strip()
         
@@ -161,45 +370,123 @@ class StudySystem:
         target = q['target_topic']
         score = self.calculate_similarity(user_answer, target)
         
-        print(f"\n모범답안: {target}")
+        lines = [f"\n모범답안: {target}"]
         
         if score >= q['evaluation']['min_similarity']:
-            print(f"✅ 좋은 답변입니다! (유사도: {score:.2f})")
-            return score
+            lines.append(f"✅ 좋은 답변입니다! (유사도: {score:.2f})")
         else:
-            print(f"⚠️ 더 구체적으로 작성해보세요. (유사도: {score:.2f})")
-            for guide in q['feedback_guides']:
-                print(f"  • {guide}")
-            return score
+            lines.append(f"⚠️ 더 구체적으로 작성해보세요. (유사도: {score:.2f})")
+            lines += [f"  • {guide}" for guide in q['feedback_guides']]
+        _emit(lines)
+        return score
+    
+    def _tokenize(self, text: str) -> List[str]:
+        """유사도 계산용 토큰 ("자유와", "자유를"이 모두 "자유"가 되도록 형태소 단위)"""
+        if self._mecab is not None:
+            # 복합 품사(예: VV+EP)는 첫 품사로 판단
+            return [surface for surface, tag in self._mecab.pos(text)
+                    if tag.split('+', 1)[0] in CONTENT_POS]
+        return _hangul_tokens(text.lower())
+    
+    def _intern_target(self, target: str) -> Tuple[int, int]:
+        """모범답안의 토큰 비트셋과 토큰 수 (처음 보는 토큰은 어휘에 추가)"""
+        entry = self._target_bits.get(target)
+        if entry is None:
+            vocab = self._vocab
+            bits = 0
+            for token in set(self._tokenize(target)):
+                bits |= 1 << vocab.setdefault(token, len(vocab))
+            entry = (bits, bits.bit_count())
+            self._target_bits[target] = entry
+        return entry
+    
+    def _build_target_matrix(self):
+        """과제별 모범답안 비트셋을 (과제 수, K) uint64 행렬로 쌓기 (K = ceil(어휘 수 / 64))"""
+        if not NUMPY_AVAILABLE:
+            # score_against_all이 과제별 정수 비트셋을 직접 비교한다
+            self._target_matrix = self._target_counts = None
+            return
+        words = max(1, (len(self._vocab) + 63) // 64)
+        matrix = np.zeros((len(self.tasks), words), dtype=np.uint64)
+        counts = np.zeros(len(self.tasks), dtype=np.int64)
+        for row, task in enumerate(self.tasks):
+            if task['target_topic'] is not None:
+                bits, counts[row] = self._target_bits[task['target_topic']]
+                matrix[row] = np.frombuffer(bits.to_bytes(words * 8, 'little'), dtype='<u8')
+        self._target_matrix = matrix
+        self._target_counts = counts
+    
+    def _answer_bits(self, answer: str) -> Tuple[int, int]:
+        """답안의 (어휘 내 토큰 비트셋, 전체 토큰 수)"""
+        answer_words = set(self._tokenize(answer))
+        vocab = self._vocab
+        answer_bits = 0
+        for token in answer_words:
+            token_id = vocab.get(token)
+            if token_id is not None:
+                answer_bits |= 1 << token_id
+        return answer_bits, len(answer_words)
+    
+    def score_against_all(self, answer: str) -> "np.ndarray":
+        """답안과 모든 과제 모범답안의 유사도 (self.tasks 순서, calculate_similarity와 같은 척도)
+        
+        NumPy가 없으면 같은 값을 float 리스트로 돌려준다.
+        """
+        answer_bits, answer_count = self._answer_bits(answer)
+        if not NUMPY_AVAILABLE:
+            scores = []
+            for task in self.tasks:
+                target = task['target_topic']
+                if target is None or not answer_count:
+                    scores.append(0.0)
+                    continue
+                target_bits, target_count = self._target_bits[target]
+                scores.append((answer_bits & target_bits).bit_count() / max(answer_count, target_count))
+            return scores
+        if not answer_count:
+            return np.zeros(len(self.tasks))
+        
+        words = self._target_matrix.shape[1]
+        answer_bits &= (1 << (words * 64)) - 1
+        answer_row = np.frombuffer(answer_bits.to_bytes(words * 8, 'little'), dtype='<u8')
+        
+        common = (self._target_matrix & answer_row).view(np.uint8)
+        common_counts = _POPCOUNT8[common].sum(axis=1, dtype=np.int64)
+        return common_counts / np.maximum(answer_count, self._target_counts)
     
     def calculate_similarity(self, answer: str, target: str) -> float:
         """간단한 유사도 계산"""
         # 단순 키워드 매칭 기반 (실제로는 KoNLPy나 임베딩 사용 권장)
-        answer_words = set(re.findall(r'[가-힣]+', answer.lower()))
-        target_words = set(re.findall(r'[가-힣]+', target.lower()))
+        target_bits, target_count = self._intern_target(target)
         
-        if not answer_words:
+        # 어휘에 없는 답안 토큰은 어떤 모범답안과도 겹치지 않으므로 개수에만 반영
+        answer_bits, answer_count = self._answer_bits(answer)
+        if not answer_count:
             return 0.0
         
-        common = answer_words & target_words
-        return len(common) / max(len(answer_words), len(target_words))
+        common = (answer_bits & target_bits).bit_count()
+        return common / max(answer_count, target_count)
     
     def run_session(self):
         """학습 세션 실행"""
-        print("\n" + "=" * 80)
-        print("🎓 한국어 읽기 이해 학습 시스템")
-        print("=" * 80)
-        print(f"총 {len(self.tasks)}개 과제 로드 완료")
+        _emit([
+            "\n" + "=" * 80,
+            "🎓 한국어 읽기 이해 학습 시스템",
+            "=" * 80,
+            f"총 {len(self.tasks)}개 과제 로드 완료"
+        ])
         
         while True:
-            print("\n" + "-" * 80)
-            print("학습 모드를 선택하세요:")
-            print("1. 문단 읽기 연습")
-            print("2. 글 읽기 연습")
-            print("3. 난이도별 학습 (easy/medium/hard)")
-            print("4. 랜덤 학습")
-            print("5. 학습 통계 보기")
-            print("0. 종료")
+            _emit([
+                "\n" + "-" * 80,
+                "학습 모드를 선택하세요:",
+                "1. 문단 읽기 연습",
+                "2. 글 읽기 연습",
+                "3. 난이도별 학습 (easy/medium/hard)",
+                "4. 랜덤 학습",
+                "5. 학습 통계 보기",
+                "0. 종료"
+            ])
             
             choice = input("\n선택: ").strip()
             
@@ -216,7 +503,7 @@ class StudySystem:
                 diff = input("난이도 선택 (easy/medium/hard): ").strip()
                 task = self.get_task_by_difficulty(diff)
             elif choice == '4':
-                task = random.choice(self.tasks) if self.tasks else None
+                task = self.get_random_task()
             elif choice == '5':
                 self.show_statistics()
                 continue
@@ -259,58 +546,83 @@ class StudySystem:
                 'total': total,
                 'timestamp': datetime.now().isoformat()
             }
-            self.score_history.append(result)
+            self.record_result(result)
             
-            print("\n" + "=" * 80)
-            print(f"📊 결과: {score}/{total} ({score/total*100:.0f}%)")
-            print("=" * 80)
+            lines = [
+                "\n" + "=" * 80,
+                f"📊 결과: {score}/{total} ({score/total*100:.0f}%)",
+                "=" * 80
+            ]
             
             if score == total:
-                print("🎉 완벽합니다! 모든 문제를 맞췄습니다!")
+                lines.append("🎉 완벽합니다! 모든 문제를 맞췄습니다!")
             elif score >= 2:
-                print("👍 잘했습니다! 계속 연습하세요.")
+                lines.append("👍 잘했습니다! 계속 연습하세요.")
             else:
-                print("💪 더 연습이 필요합니다. 다시 도전해보세요!")
+                lines.append("💪 더 연습이 필요합니다. 다시 도전해보세요!")
+            _emit(lines)
+    
+    @property
+    def score_history(self) -> List[Dict]:
+        """학습 기록을 결과별 dict 목록으로 반환"""
+        return [
+            {'task_id': task_id, 'task_type': task_type, 'difficulty': difficulty,
+             'score': score, 'total': total, 'timestamp': timestamp}
+            for task_id, task_type, difficulty, score, total, timestamp in zip(
+                self.task_ids, self.task_types, self.difficulties,
+                self.scores, self.totals, self.timestamps)
+        ]
+    
+    def record_result(self, result: Dict):
+        """과제 결과를 기록하고 통계 누적값 갱신"""
+        score = result['score']
+        self.task_ids.append(result['task_id'])
+        self.task_types.append(result['task_type'])
+        self.difficulties.append(result['difficulty'])
+        self.scores.append(score)
+        self.totals.append(result['total'])
+        self.timestamps.append(result['timestamp'])
+        
+        self._score_sum += score
+        for stats in (self._difficulty_stats[result['difficulty']],
+                      self._type_stats[result['task_type']]):
+            stats[0] += score
+            stats[1] += 1
     
     def show_statistics(self):
         """학습 통계 표시"""
-        if not self.score_history:
+        if not self.scores:
             print("\n아직 학습 기록이 없습니다.")
             return
         
-        print("\n" + "=" * 80)
-        print("📈 학습 통계")
-        print("=" * 80)
+        total_tasks = len(self.scores)
+        avg_score = self._score_sum / total_tasks
         
-        total_tasks = len(self.score_history)
-        avg_score = sum(h['score'] for h in self.score_history) / total_tasks
-        
-        print(f"총 학습 과제: {total_tasks}개")
-        print(f"평균 점수: {avg_score:.1f}/3 ({avg_score/3*100:.0f}%)")
+        lines = [
+            "\n" + "=" * 80,
+            "📈 학습 통계",
+            "=" * 80,
+            f"총 학습 과제: {total_tasks}개",
+            f"평균 점수: {avg_score:.1f}/3 ({avg_score/3*100:.0f}%)"
+        ]
         
         # 난이도별 통계
         for diff in ['easy', 'medium', 'hard']:
-            diff_tasks = [h for h in self.score_history if h['difficulty'] == diff]
-            if diff_tasks:
-                diff_avg = sum(h['score'] for h in diff_tasks) / len(diff_tasks)
-                print(f"{diff} 난이도: {len(diff_tasks)}개, 평균 {diff_avg:.1f}/3")
+            diff_score, diff_count = self._difficulty_stats.get(diff, (0, 0))
+            if diff_count:
+                lines.append(f"{diff} 난이도: {diff_count}개, 평균 {diff_score / diff_count:.1f}/3")
         
         # 타입별 통계
-        para_tasks = [h for h in self.score_history if h['task_type'] == 'paragraph']
-        art_tasks = [h for h in self.score_history if h['task_type'] == 'article']
-        
-        if para_tasks:
-            para_avg = sum(h['score'] for h in para_tasks) / len(para_tasks)
-            print(f"문단 과제: {len(para_tasks)}개, 평균 {para_avg:.1f}/3")
-        
-        if art_tasks:
-            art_avg = sum(h['score'] for h in art_tasks) / len(art_tasks)
-            print(f"글 과제: {len(art_tasks)}개, 평균 {art_avg:.1f}/3")
+        for task_type, label in (('paragraph', '문단 과제'), ('article', '글 과제')):
+            type_score, type_count = self._type_stats.get(task_type, (0, 0))
+            if type_count:
+                lines.append(f"{label}: {type_count}개, 평균 {type_score / type_count:.1f}/3")
         
         # 학습 시간
         duration = datetime.now() - self.session_start
         minutes = int(duration.total_seconds() / 60)
-        print(f"\n학습 시간: {minutes}분")
+        lines.append(f"\n학습 시간: {minutes}분")
+        _emit(lines)
 
 def main():
     """메인 실행 함수"""
@@ -8,16 +8,36 @@ import subprocess
 import time
 import json
 import requests
+import urllib3
 import logging
 import sys
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 헬스 체크 연결/응답 타임아웃과 대기 중 재시도 간격 (초)
+HEALTH_CONNECT_TIMEOUT = 0.5
+HEALTH_TIMEOUT = 2
+POLL_INITIAL_DELAY = 0.25
+POLL_MAX_DELAY = 2.0
+
+# Docker Compose 실행 명령과 실패 시 로그에 남길 마지막 출력 줄 수
+COMPOSE_CMD = ["docker-compose", "-f", "docker-compose.yml", "-f", "docker-compose.quiz.yml"]
+COMPOSE_TAIL_LINES = 50
+
+def _count_json(directory: Path, prefix: str = "") -> int:
+    """디렉터리의 {prefix}*.json 파일 수 (glob과 같이 숨김 파일 제외)"""
+    with os.scandir(directory) as entries:
+        return sum(1 for e in entries
+                   if e.name.endswith(".json") and e.name.startswith(prefix)
+                   and not e.name.startswith(".") and e.is_file())
+
 class SystemIntegration:
     """시스템 통합 관리자"""
     
@@ -49,6 +69,14 @@ class SystemIntegration:
             "quiz_system_ready": False,
             "api_endpoints_ready": False
         }
+        
+        # 헬스 체크는 127.0.0.1로 바로 접속하고 keep-alive 연결을 재사용
+        self._http = urllib3.PoolManager(
+            num_pools=len(self.services),
+            maxsize=16,
+            retries=False,
+            timeout=urllib3.Timeout(connect=HEALTH_CONNECT_TIMEOUT, read=HEALTH_TIMEOUT)
+        )
     
     def check_service_health(self, service_name: str) -> bool:
         """서비스 헬스 체크"""
@@ -57,10 +85,9 @@ class SystemIntegration:
             return False
             
         try:
-            url = f"http://localhost:{service['port']}{service['health']}"
-            response = requests.get(url, timeout=5)
-            return response.status_code == 200
-        except requests.exceptions.RequestException:
+            url = f"http://127.0.0.1:{service['port']}{service['health']}"
+            return self._http.request("GET", url).status == 200
+        except urllib3.exceptions.HTTPError:
             return False
     
     def wait_for_service(self, service_name: str, timeout: int = 60) -> bool:
@@ -68,15 +95,33 @@ class SystemIntegration:
         logger.info(f"Waiting for {service_name} to be ready...")
         
         start_time = time.time()
+        delay = POLL_INITIAL_DELAY
         while time.time() - start_time < timeout:
             if self.check_service_health(service_name):
                 logger.info(f"✅ {service_name} is ready")
                 return True
-            time.sleep(5)
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
         
         logger.error(f"❌ {service_name} failed to start within {timeout} seconds")
         return False
     
+    def _run_compose(self, args: List[str]) -> Tuple[int, str]:
+        """Docker Compose 실행, 출력은 줄 단위로 debug 로그에 흘려보냄
+        
+        Returns:
+            (종료 코드, 마지막 COMPOSE_TAIL_LINES줄의 출력)
+        """
+        tail = deque(maxlen=COMPOSE_TAIL_LINES)
+        with subprocess.Popen(COMPOSE_CMD + args, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                logger.debug(line)
+                tail.append(line)
+            returncode = proc.wait()
+        return returncode, "\n".join(tail)
+    
     def start_services(self, services: List[str] = None) -> bool:
         """서비스 시작"""
         if services is None:
@@ -86,20 +131,15 @@ class SystemIntegration:
         
         try:
             # Docker Compose로 서비스 시작
-            cmd = ["docker-compose", "-f", "docker-compose.yml", "-f", "docker-compose.quiz.yml", "up", "-d"] + services
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            returncode, output = self._run_compose(["up", "-d"] + services)
             
-            if result.returncode != 0:
-                logger.error(f"Failed to start services: {result.stderr}")
+            if returncode != 0:
+                logger.error(f"Failed to start services: {output}")
                 return False
             
-            # 서비스 준비 대기
-            all_ready = True
-            for service in services:
-                if not self.wait_for_service(service):
-                    all_ready = False
-            
-            return all_ready
+            # 서비스 준비 대기 (동시에)
+            with ThreadPoolExecutor(max_workers=max(1, len(services))) as executor:
+                return all(list(executor.map(self.wait_for_service, services)))
             
         except Exception as e:
             logger.error(f"Error starting services: {e}")
@@ -113,14 +153,13 @@ class SystemIntegration:
         logger.info("Stopping integration services...")
         
         try:
-            cmd = ["docker-compose", "-f", "docker-compose.yml", "-f", "docker-compose.quiz.yml", "stop"] + services
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            returncode, output = self._run_compose(["stop"] + services)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("✅ Services stopped successfully")
                 return True
             else:
-                logger.error(f"Failed to stop services: {result.stderr}")
+                logger.error(f"Failed to stop services: {output}")
                 return False
                 
         except Exception as e:
@@ -136,16 +175,16 @@ class SystemIntegration:
                 logger.warning("Output directory not found")
                 return False
             
-            json_files = list(out_dir.glob("*.json"))
-            logger.info(f"Found {len(json_files)} JSON files in output directory")
+            json_count = _count_json(out_dir)
+            logger.info(f"Found {json_count} JSON files in output directory")
             
             # 품질 평가 보고서 확인
             reports_dir = Path("generator/test_reports")
             if reports_dir.exists():
-                report_files = list(reports_dir.glob("quality_*.json"))
-                logger.info(f"Found {len(report_files)} quality reports")
+                report_count = _count_json(reports_dir, "quality_")
+                logger.info(f"Found {report_count} quality reports")
             
-            self.integration_status["data_pipeline_ready"] = len(json_files) > 0
+            self.integration_status["data_pipeline_ready"] = json_count > 0
             return self.integration_status["data_pipeline_ready"]
             
         except Exception as e:
@@ -291,10 +330,13 @@ class SystemIntegration:
             "integration_status": self.integration_status
         }
         
-        # 서비스 상태 확인
-        for service_name in self.services:
+        # 서비스 상태 확인 (동시에)
+        names = list(self.services)
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            healths = dict(zip(names, executor.map(self.check_service_health, names)))
+        for service_name in names:
             status["services"][service_name] = {
-                "healthy": self.check_service_health(service_name),
+                "healthy": healths[service_name],
                 "port": self.services[service_name].get("port")
             }
         
@@ -302,11 +344,11 @@ class SystemIntegration:
         try:
             out_dir = Path("generator/out")
             if out_dir.exists():
-                status["data_stats"]["total_items"] = len(list(out_dir.glob("*.json")))
+                status["data_stats"]["total_items"] = _count_json(out_dir)
             
             reports_dir = Path("generator/test_reports")
             if reports_dir.exists():
-                status["data_stats"]["quality_reports"] = len(list(reports_dir.glob("quality_*.json")))
+                status["data_stats"]["quality_reports"] = _count_json(reports_dir, "quality_")
         except Exception as e:
             logger.warning(f"Error collecting data stats: {e}")
         
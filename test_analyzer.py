@@ -3,10 +3,6 @@
 Test the Korean Sentence Analyzer for summary learning system
 """
 
-import sys
-import os
-sys.path.append('/Users/jihunkong/reading-json')
-
 from core.nlp.korean_analyzer import KoreanSentenceAnalyzer, SentenceAnalysis
 
 def test_comprehensive_analysis():
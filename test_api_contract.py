@@ -5,35 +5,59 @@ API Contract Test for Korean Reading Comprehension System
 Tests the new /api/get_task and /api/submit_answer endpoints
 """
 
-import requests
 import json
+from typing import Any, Dict
+
+from pydantic import BaseModel, ConfigDict
+
+from _script_helpers import buffered_stdout, get_session
 
 BASE_URL = "http://localhost:8080"
 
+# Response contracts: parsed and type-checked in one pass by model_validate_json
+class _Contract(BaseModel):
+    """Strict types (no coercion); fields outside the contract are kept"""
+    model_config = ConfigDict(strict=True, extra='allow')
+
+    def field_names(self):
+        return [*type(self).model_fields, *self.model_extra]
+
+class TaskResponse(_Contract):
+    success: bool
+    task: Dict[str, Any]
+
+class SubmitResponse(_Contract):
+    success: bool
+    correct: bool
+    feedback: str
+
+class ErrorResponse(_Contract):
+    success: bool
+    error: Any
+
 def test_get_task_contract():
     """Test /api/get_task endpoint contract"""
     print("🔍 Testing /api/get_task endpoint...")
 
-    response = requests.post(f"{BASE_URL}/api/get_task",
-                           json={"source": "auto"})
+    response = get_session().post(f"{BASE_URL}/api/get_task",
+                                  json={"source": "auto"})
 
     print(f"Status Code: {response.status_code}")
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-    data = response.json()
-    print(f"Response keys: {list(data.keys())}")
+    data = TaskResponse.model_validate_json(response.content)
+    print(f"Response keys: {data.field_names()}")
 
-    # Contract verification
-    assert data["success"] is True, "Response should have success=True"
-    assert "task" in data, "Response should contain 'task' field"
-    assert isinstance(data["task"], dict), "Task should be a dictionary"
+    # Contract verification (field presence and types are checked by the schema)
+    assert data.success is True, "Response should have success=True"
 
-    task = data["task"]
+    task = data.task
 
-    # Basic task structure validation
-    required_fields = ["id"]
-    for field in required_fields:
-        assert field in task, f"Task should contain '{field}' field"
+    # Basic task structure validation (skipped entirely under python -O)
+    if __debug__:
+        required_fields = ["id"]
+        for field in required_fields:
+            assert field in task, f"Task should contain '{field}' field"
 
     print("✅ /api/get_task contract test passed!")
     return task
@@ -42,23 +66,19 @@ def test_submit_answer_contract(task):
     """Test /api/submit_answer endpoint contract"""
     print("🔍 Testing /api/submit_answer endpoint...")
 
-    response = requests.post(f"{BASE_URL}/api/submit_answer",
-                           json={"task": task, "answer_index": 0})
+    response = get_session().post(f"{BASE_URL}/api/submit_answer",
+                                  json={"task": task, "answer_index": 0})
 
     print(f"Status Code: {response.status_code}")
     assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
-    data = response.json()
-    print(f"Response keys: {list(data.keys())}")
+    data = SubmitResponse.model_validate_json(response.content)
+    print(f"Response keys: {data.field_names()}")
 
-    # Contract verification
-    assert data["success"] is True, "Response should have success=True"
-    assert "correct" in data, "Response should contain 'correct' field"
-    assert "feedback" in data, "Response should contain 'feedback' field"
-    assert isinstance(data["correct"], bool), "Correct should be boolean"
-    assert isinstance(data["feedback"], str), "Feedback should be string"
+    # Contract verification (field presence and types are checked by the schema)
+    assert data.success is True, "Response should have success=True"
 
-    print(f"Grading result: correct={data['correct']}, feedback='{data['feedback'][:50]}...'")
+    print(f"Grading result: correct={data.correct}, feedback='{data.feedback[:50]}...'")
     print("✅ /api/submit_answer contract test passed!")
 
 def test_error_handling():
@@ -66,12 +86,11 @@ def test_error_handling():
     print("🔍 Testing error handling...")
 
     # Test submit_answer with missing data
-    response = requests.post(f"{BASE_URL}/api/submit_answer", json={})
+    response = get_session().post(f"{BASE_URL}/api/submit_answer", json={})
     assert response.status_code == 400, "Should return 400 for missing data"
 
-    data = response.json()
-    assert data["success"] is False, "Error response should have success=False"
-    assert "error" in data, "Error response should contain 'error' field"
+    data = ErrorResponse.model_validate_json(response.content)
+    assert data.success is False, "Error response should have success=False"
 
     print("✅ Error handling test passed!")
 
@@ -101,5 +120,6 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    with buffered_stdout():
+        success = main()
     exit(0 if success else 1)
\ No newline at end of file
@@ -4,7 +4,36 @@ Test script to validate model answer extraction from parallel_sets JSON files
 """
 
 import json
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from _script_helpers import buffered_stdout
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Answer field names to try, in order, for each question type
+_KEYWORDS_KEYS = ('answer', 'answer_index')
+_CENTER_KEYS = ('answer', 'answer_idx', 'answer_index')
+_TOPIC_KEYS = ('answer', 'target_answer', 'target_topic')
+
+def _first_present(d, keys, default='NOT_FOUND'):
+    """Value of the first key in keys that d contains"""
+    for key in keys:
+        if key in d:
+            return d[key]
+    return default
+
+def _load(file_path):
+    """Read and parse one task file, or None if it does not exist"""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return _loads(data)
 
 def test_model_answer_extraction():
     """Test that model answers can be correctly extracted from parallel_sets JSON"""
@@ -17,13 +46,14 @@ def test_model_answer_extraction():
         "/Users/jihunkong/reading-json/generator/parallel_sets/set_1/paragraphs/para_20231010_7890.json"
     ]
     
-    for file_path in test_files:
-        if not Path(file_path).exists():
+    # Read all files concurrently; map keeps the output in file order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tasks = list(executor.map(_load, test_files))
+    
+    for file_path, task in zip(test_files, tasks):
+        if task is None:
             print(f"❌ File not found: {file_path}")
             continue
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            task = json.load(f)
         
         print(f"\n📄 Testing: {task['id']}")
         print(f"   Topic: {task['topic']}")
@@ -33,18 +63,18 @@ def test_model_answer_extraction():
         
         # Keywords MCQ
         q_keywords = task.get('q_keywords_mcq', {})
-        keywords_answer = q_keywords.get('answer', q_keywords.get('answer_index', 'NOT_FOUND'))
+        keywords_answer = _first_present(q_keywords, _KEYWORDS_KEYS)
         print(f"   • Keywords answer: {keywords_answer} (type: {type(keywords_answer)})")
         
         # Center sentence MCQ  
         q_center = task.get('q_center_sentence_mcq', {})
-        center_answer = q_center.get('answer', q_center.get('answer_idx', q_center.get('answer_index', 'NOT_FOUND')))
+        center_answer = _first_present(q_center, _CENTER_KEYS)
         print(f"   • Center sentence answer: {center_answer} (type: {type(center_answer)})")
         
         # Free response answer extraction
         print("\n   Free Response Question:")
         q_topic = task.get('q_topic_free', {})
-        topic_answer = q_topic.get('answer', q_topic.get('target_answer', q_topic.get('target_topic', 'NOT_FOUND')))
+        topic_answer = _first_present(q_topic, _TOPIC_KEYS)
         print(f"   • Topic answer: '{topic_answer}' (type: {type(topic_answer)})")
         print(f"   • Answer length: {len(str(topic_answer)) if topic_answer != 'NOT_FOUND' else 0} characters")
         
@@ -55,4 +85,5 @@ def test_model_answer_extraction():
             print("   ✅ All answers found successfully")
 
 if __name__ == "__main__":
-    test_model_answer_extraction()
\ No newline at end of file
+    with buffered_stdout():
+        test_model_answer_extraction()
\ No newline at end of file
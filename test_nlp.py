@@ -4,8 +4,20 @@ Test script for Korean NLP functionality using KoNLPy
 """
 
 from konlpy.tag import Mecab, Okt
+from functools import lru_cache
 import sys
 
+from _script_helpers import buffered_stdout
+
+@lru_cache(maxsize=None)
+def _get_analyzer(name):
+    """Shared analyzer instance ('mecab' or 'okt'); construct analyzers only through here
+
+    Mecab loads its dictionary and Okt starts a JVM, so each is built at most
+    once per process and reused by every caller.
+    """
+    return Mecab() if name == 'mecab' else Okt()
+
 def test_korean_nlp():
     """Test Korean NLP analyzers"""
     
@@ -18,15 +30,13 @@ def test_korean_nlp():
     
     # Try Mecab first (most accurate)
     try:
-        mecab = Mecab()
+        mecab = _get_analyzer('mecab')
         print("✅ Mecab analyzer available")
         
-        # Morphological analysis
-        morphs = mecab.morphs(test_sentence)
-        print(f"Morphemes: {morphs}")
-        
-        # POS tagging
+        # POS tagging (one analyzer call; morphemes are its first column)
         pos_tags = mecab.pos(test_sentence)
+        morphs = [word for word, _ in pos_tags]
+        print(f"Morphemes: {morphs}")
         print(f"POS tags: {pos_tags}")
         
         # Extract sentence components
@@ -39,13 +49,12 @@ def test_korean_nlp():
         
         # Fallback to Okt
         try:
-            okt = Okt()
+            okt = _get_analyzer('okt')
             print("✅ Okt analyzer available")
             
-            morphs = okt.morphs(test_sentence)
-            print(f"Morphemes: {morphs}")
-            
             pos_tags = okt.pos(test_sentence)
+            morphs = [word for word, _ in pos_tags]
+            print(f"Morphemes: {morphs}")
             print(f"POS tags: {pos_tags}")
             
             components = extract_sentence_components(pos_tags)
@@ -57,6 +66,33 @@ def test_korean_nlp():
     
     return True
 
+# Component bucket per POS tag: exact tags first, then tag prefixes in order
+_SUBJECT_TAGS = frozenset(['JX', 'JKS'])           # 보조사, 주격조사
+_SUBJECT_MARKERS = frozenset(['는', '은', '이', '가'])
+_POS_BUCKETS = {
+    'JKO': 'objects',      # 목적격조사
+    'MM': 'modifiers',     # 관형사
+    'MAG': 'modifiers',    # 일반부사
+}
+_POS_PREFIX_BUCKETS = (
+    ('V', 'predicates'),   # 동사
+    ('XSV', 'predicates'), # 동사 파생 접미사
+    ('MAG', 'adverbs'),    # 부사 (복합 태그)
+)
+
+@lru_cache(maxsize=None)
+def _pos_bucket(pos):
+    """Component bucket for a POS tag, or None if the tag is not collected"""
+    if pos in _SUBJECT_TAGS:
+        return 'subjects'
+    bucket = _POS_BUCKETS.get(pos)
+    if bucket:
+        return bucket
+    for prefix, bucket in _POS_PREFIX_BUCKETS:
+        if pos.startswith(prefix):
+            return bucket
+    return None
+
 def extract_sentence_components(pos_tags):
     """Extract basic sentence components from POS tags"""
     components = {
@@ -68,35 +104,21 @@ def extract_sentence_components(pos_tags):
     }
     
     for word, pos in pos_tags:
-        # Subject markers (은/는, 이/가)
-        if pos in ['JX', 'JKS']:  # 보조사, 주격조사
-            if word in ['는', '은', '이', '가']:
-                components['subjects'].append((word, pos))
-        
-        # Predicates (verbs and adjectives)
-        elif pos.startswith('V'):  # 동사
-            components['predicates'].append((word, pos))
-        elif pos.startswith('XSV'):  # 동사 파생 접미사
-            components['predicates'].append((word, pos))
-            
-        # Objects (을/를 markers)
-        elif pos == 'JKO':  # 목적격조사
-            components['objects'].append((word, pos))
-            
-        # Modifiers (관형어)
-        elif pos in ['MM', 'MAG']:  # 관형사, 일반부사
-            components['modifiers'].append((word, pos))
-            
-        # Adverbials
-        elif pos.startswith('MAG'):  # 부사
-            components['adverbs'].append((word, pos))
+        bucket = _pos_bucket(pos)
+        if bucket is None:
+            continue
+        # Subject markers (은/는, 이/가) only; other 보조사 are skipped
+        if bucket == 'subjects' and word not in _SUBJECT_MARKERS:
+            continue
+        components[bucket].append((word, pos))
     
     return components
 
 if __name__ == "__main__":
-    success = test_korean_nlp()
-    if success:
-        print("\n✅ Korean NLP setup successful!")
-    else:
-        print("\n❌ Korean NLP setup failed!")
-        sys.exit(1)
\ No newline at end of file
+    with buffered_stdout():
+        success = test_korean_nlp()
+        if success:
+            print("\n✅ Korean NLP setup successful!")
+        else:
+            print("\n❌ Korean NLP setup failed!")
+            sys.exit(1)
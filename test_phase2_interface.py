@@ -5,10 +5,11 @@ Tests the drag-and-drop necessity judgment functionality
 """
 
 import sys
-import os
-sys.path.append('/Users/jihunkong/reading-json')
+import re
 
 from flask import Flask
+
+from _script_helpers import buffered_stdout
 from app.learning_routes import learning_bp
 from core.learning import LearningPhaseController, EnhancedLearningTask
 import json
@@ -139,10 +140,9 @@ def validate_interface_completeness():
         with open(routes_file, 'r', encoding='utf-8') as f:
             content = f.read()
             
-        missing_functions = []
-        for func in required_functions:
-            if f"function {func}" not in content:
-                missing_functions.append(func)
+        # One pass over the file collects every declared function name
+        defined_functions = set(re.findall(r'function\s+(\w+)', content))
+        missing_functions = [func for func in required_functions if func not in defined_functions]
         
         if missing_functions:
             print(f"❌ Missing functions: {missing_functions}")
@@ -161,10 +161,9 @@ def validate_interface_completeness():
             '.drag-over'
         ]
         
-        missing_css = []
-        for css_class in required_css_classes:
-            if css_class not in content:
-                missing_css.append(css_class)
+        css_pattern = re.compile('|'.join(map(re.escape, required_css_classes)))
+        found_css = set(css_pattern.findall(content))
+        missing_css = [css_class for css_class in required_css_classes if css_class not in found_css]
         
         if missing_css:
             print(f"⚠️ Missing CSS classes: {missing_css}")
@@ -222,5 +221,7 @@ def main():
     return passed == total
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    with buffered_stdout():
+        success = main()
+    
+    sys.exit(0 if success else 1)
@@ -4,11 +4,8 @@ Test Korean phrase analyzer integration with Phase 1 controller
 """
 
 import sys
-import os
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from _script_helpers import buffered_stdout
 from core.learning.phase_controller import LearningPhaseController
 from dataclasses import dataclass
 from typing import List
@@ -92,10 +89,11 @@ def test_phrase_analysis():
         return False
 
 if __name__ == "__main__":
-    success = test_phrase_analysis()
-    if success:
-        print("\n🎉 Integration test successful!")
-    else:
-        print("\n💥 Integration test failed!")
+    with buffered_stdout():
+        success = test_phrase_analysis()
+        if success:
+            print("\n🎉 Integration test successful!")
+        else:
+            print("\n💥 Integration test failed!")
     
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -5,11 +5,29 @@ Test the simplified Korean reading comprehension system
 Only topic questions, random task selection
 """
 
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+from _script_helpers import get_session
 
 BASE_URL = "http://localhost:8080"
 
+def _get_task(_=None):
+    """POST /api/get_task for an automatically chosen task"""
+    return get_session().post(f"{BASE_URL}/api/get_task", json={"source": "auto"})
+
+def _submit(payload):
+    """POST a raw payload to /api/submit_answer"""
+    return get_session().post(f"{BASE_URL}/api/submit_answer", json=payload)
+
+def _submit_topic(task, answer):
+    """POST one topic answer to /api/submit_answer"""
+    return _submit({
+        "task": task,
+        "question_type": "topic",
+        "answer": answer
+    })
+
 def test_simplified_system():
     """Test the simplified system with only topic questions"""
     print("🔍 Testing simplified Korean reading comprehension system...")
@@ -18,10 +36,11 @@ def test_simplified_system():
     print("\n📚 Testing random task selection...")
     task_ids = set()
 
-    for i in range(5):
-        response = requests.post(f"{BASE_URL}/api/get_task",
-                               json={"source": "auto"})
+    # The five retrievals are independent: fetch together, report in order
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses = list(executor.map(_get_task, range(5)))
 
+    for i, response in enumerate(responses):
         if response.status_code != 200:
             print(f"❌ Failed to get task {i+1}: {response.status_code}")
             continue
@@ -43,7 +62,7 @@ def test_simplified_system():
     print("\n📝 Testing topic question grading...")
 
     # Get a fresh task
-    response = requests.post(f"{BASE_URL}/api/get_task", json={"source": "auto"})
+    response = _get_task()
     if response.status_code != 200:
         print(f"❌ Failed to get task for grading test")
         return False
@@ -65,14 +84,11 @@ def test_simplified_system():
         ""  # Empty
     ]
 
-    for i, answer in enumerate(test_answers):
-        print(f"\n   Testing answer {i+1}: '{answer[:50]}{'...' if len(answer) > 50 else ''}'")
+    with ThreadPoolExecutor(max_workers=len(test_answers)) as executor:
+        responses = list(executor.map(lambda answer: _submit_topic(task, answer), test_answers))
 
-        response = requests.post(f"{BASE_URL}/api/submit_answer", json={
-            "task": task,
-            "question_type": "topic",
-            "answer": answer
-        })
+    for i, (answer, response) in enumerate(zip(test_answers, responses)):
+        print(f"\n   Testing answer {i+1}: '{answer[:50]}{'...' if len(answer) > 50 else ''}'")
 
         if response.status_code == 200:
             result = response.json()
@@ -87,23 +103,26 @@ def test_simplified_system():
     # Test error cases
     print("\n🧪 Testing error handling...")
 
-    # Wrong question type
-    response = requests.post(f"{BASE_URL}/api/submit_answer", json={
-        "task": task,
-        "question_type": "keywords",  # No longer supported
-        "answer": "test"
-    })
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Wrong question type
+        wrong_type = executor.submit(_submit, {
+            "task": task,
+            "question_type": "keywords",  # No longer supported
+            "answer": "test"
+        })
 
+        # Missing parameters
+        missing_params = executor.submit(_submit, {
+            "task": task
+            # Missing question_type and answer
+        })
+
+    response = wrong_type.result()
     if response.status_code == 200:
         result = response.json()
         print(f"   Wrong question type: {result.get('feedback', 'No feedback')}")
 
-    # Missing parameters
-    response = requests.post(f"{BASE_URL}/api/submit_answer", json={
-        "task": task
-        # Missing question_type and answer
-    })
-
+    response = missing_params.result()
     print(f"   Missing params: Status {response.status_code}")
 
     print("\n✅ Simplified system testing completed!")
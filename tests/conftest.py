@@ -0,0 +1,11 @@
+"""
+pytest 공통 설정: 프로젝트 루트를 import 경로에 한 번만 추가
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)